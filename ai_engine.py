@@ -10,15 +10,133 @@ NEW FEATURES:
 """
 
 import json
+import logging
+import logging.handlers
+import os
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
+from collections import Counter
+from enum import IntEnum
 from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import islice
 import warnings
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 warnings.filterwarnings('ignore')
 
+# Per-project progress goes through this logger; analyze_all_projects attaches
+# a buffered stdout handler so thousands of lines become one flush
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Detected column keys that hold numbers (often as currency text in exports)
+NUMERIC_KEYS = ('budget', 'capex', 'opex', 'eac', 'actual_cost', 'hours', 'actual_hours', 'completion')
+CURRENCY_CHARS = str.maketrans('', '', ',$€')
+DATE_KEYS = ('start_date', 'finish_date', 'forecast_finish', 'snapshot_date', 'approval_date')
+
+
+class Severity(IntEnum):
+    """Consistency-rule severities, ordered so thresholds are integer compares"""
+    INFO = 0
+    WARNING = 1
+    CRITICAL = 2
+
+
+# Health/risk labels scored 3 (good) .. 1 (bad); anything else scores 2
+HEALTH_SCORES = {
+    'green': 3, 'yellow': 2, 'red': 1,
+    'on track': 3, 'at risk': 2, 'delayed': 1,
+    'low': 3, 'medium': 2, 'high': 1
+}
+
+# Display order of insight severities (most urgent first); unknown labels sort with 'info'
+SEVERITY_RANK = {'critical': 0, 'high': 1, 'warning': 2, 'info': 3}
+
+# Opening sentence of every project summary, prebuilt per overall status
+STATUS_SUMMARY = {
+    status: f"Project classified as '{status}' based on cross-source analysis."
+    for status in ('On Track', 'At Risk', 'Delayed')
+}
+
+# (output key, detected column key, kind) read into each project's baseline / latest Wave
+# snapshot; resolved against the detected columns once per load
+BASELINE_FIELDS = (
+    ('baseline_start', 'start_date', 'date'),
+    ('baseline_finish', 'finish_date', 'date'),
+    ('total_budget', 'budget', 'numeric'),
+    ('capex', 'capex', 'numeric'),
+    ('opex', 'opex', 'numeric'),
+    ('eac', 'eac', 'numeric'),
+    ('planned_hours', 'hours', 'numeric'),
+    ('schedule_health', 'schedule_health', 'value'),
+    ('budget_health', 'budget_health', 'value'),
+    ('risk_level', 'risk', 'value'),
+    ('owner', 'owner', 'value'),
+    ('strategic_alignment', 'strategic_alignment', 'value'),
+    ('benefits', 'benefits', 'value'),
+    ('completion_pct', 'completion', 'numeric'),
+    ('stage', 'stage', 'value'),
+    ('interdependencies', 'interdependencies', 'value'),
+)
+WAVE_FIELDS = (
+    ('snapshot_date', 'snapshot_date', 'date'),
+    ('status', 'status', 'text'),
+    ('stage', 'stage', 'text'),
+    ('forecast_finish', 'forecast_finish', 'date'),
+    ('completion_pct', 'completion', 'numeric'),
+    ('complexity', 'complexity', 'text'),
+    ('owner', 'owner', 'text'),
+    ('budget', 'budget', 'numeric'),
+    ('value_lever', 'value_lever', 'text'),
+    ('approval_date', 'approval_date', 'date'),
+)
+
+
+@lru_cache(maxsize=512)
+def _classify_health_cached(schedule: str, budget: str, risk: str) -> str:
+    """Overall status from normalized health labels (few distinct combinations, so memoized)"""
+    avg_score = (HEALTH_SCORES.get(schedule, 2) + HEALTH_SCORES.get(budget, 2) + HEALTH_SCORES.get(risk, 2)) / 3
+    
+    if avg_score >= 2.5:
+        return "On Track"
+    elif avg_score >= 1.5:
+        return "At Risk"
+    else:
+        return "Delayed"
+
+
+@lru_cache(maxsize=100_000)
+def _normalize_id_cached(project_id: str) -> str:
+    """Canonical cross-system form of a project ID string (memoized)"""
+    return project_id.strip().upper()
+
+
+@lru_cache(maxsize=4096)
+def _similarity(s1: str, s2: str) -> float:
+    """SequenceMatcher ratio of two normalized strings (memoized)"""
+    return SequenceMatcher(None, s1, s2).ratio()
+
+
+def _transpose(rows: List[tuple], width: int, dtype) -> List[np.ndarray]:
+    """One array per field from per-project tuples (empty arrays when there are no rows)"""
+    return [np.array(col, dtype=dtype) for col in (zip(*rows) if rows else [()] * width)]
+
+
+def _truthy(values: np.ndarray) -> np.ndarray:
+    """Elementwise Python truthiness of a NaN-for-missing float column (missing and 0 are falsy)"""
+    return np.nan_to_num(values) != 0
+
+
 
 class PortfolioAIEngine:
     """
@@ -36,12 +154,17 @@ class PortfolioAIEngine:
     TIER-4: Execution Hygiene (Phantom Work, Task Hygiene, Idle Capacity)
     """
     
-    def __init__(self):
-        """Initialize the Portfolio AI Engine"""
+    def __init__(self, verbose: bool = False):
+        """Initialize the Portfolio AI Engine (verbose=True streams per-project progress live)"""
+        self.verbose = verbose
         self.smartsheet_data = None
         self.wave_data = None
         self.tick_data = None
         self.projects = {}
+        self._valid_project_ids = set()
+        self._project_names = {}
+        self._schedule_health_lc = {}
+        self._status_lc = {}
         self.portfolio_insights = {}
         
         # Column mappings (auto-detected)
@@ -53,6 +176,22 @@ class PortfolioAIEngine:
         self.executive_insights = []
         self.vp_insights = []
         self.manager_insights = []
+        self._exec_by_pid = {}
+        self._vp_by_pid = {}
+        self._mgr_by_pid = {}
+        
+        # Per-project lookups precomputed at load time
+        self._smartsheet_idx = {}
+        self._baseline_extractors = []
+        self._wave_extractors = []
+        self._health_status = {}
+        self._wave_by_id = {}
+        self._wave_latest = {}
+        self._wave_names = ([], [])
+        self._tick_agg = None
+        self._tick_unique_ids = None
+        self._tick_names = ([], [])
+        self._tick_gb = None
         
     def _is_valid_project_id(self, project_id) -> bool:
         """Check if project_id is valid (not None, empty, or Unknown)"""
@@ -64,31 +203,41 @@ class PortfolioAIEngine:
                 return False
         return True
     
-    def _detect_column(self, df: pd.DataFrame, patterns: List[str], col_type: str = "column") -> Optional[str]:
+    def _column_keys(self, df: pd.DataFrame) -> List[Tuple[Any, str, str]]:
+        """Lowercased and separator-free forms of each column name, computed once per DataFrame"""
+        keys = []
+        for col in df.columns:
+            col_lower = str(col).lower().strip()
+            keys.append((col, col_lower, col_lower.replace('_', '').replace(' ', '').replace('-', '')))
+        return keys
+    
+    def _detect_column(self, df: pd.DataFrame, patterns: List[str], col_type: str = "column",
+                       column_keys: Optional[List[Tuple[Any, str, str]]] = None) -> Optional[str]:
         """
         Intelligently detect a column by trying multiple patterns
         """
         if df is None or df.empty:
             return None
         
-        for col in df.columns:
-            col_lower = str(col).lower().strip()
-            for pattern in patterns:
-                if col_lower == pattern.lower().strip():
-                    return col
+        if column_keys is None:
+            column_keys = self._column_keys(df)
         
-        for col in df.columns:
-            col_lower = str(col).lower().strip()
-            for pattern in patterns:
-                pattern_lower = pattern.lower().strip()
+        pattern_lowers = [pattern.lower().strip() for pattern in patterns]
+        
+        exact_patterns = set(pattern_lowers)
+        for col, col_lower, _ in column_keys:
+            if col_lower in exact_patterns:
+                return col
+        
+        for col, col_lower, _ in column_keys:
+            for pattern_lower in pattern_lowers:
                 if pattern_lower in col_lower or col_lower in pattern_lower:
                     return col
         
-        for col in df.columns:
-            col_normalized = str(col).lower().strip().replace('_', '').replace(' ', '').replace('-', '')
-            for pattern in patterns:
-                pattern_normalized = pattern.lower().strip().replace('_', '').replace(' ', '').replace('-', '')
-                if col_normalized == pattern_normalized or pattern_normalized in col_normalized:
+        pattern_normalized = [p.replace('_', '').replace(' ', '').replace('-', '') for p in pattern_lowers]
+        for col, _, col_normalized in column_keys:
+            for pattern in pattern_normalized:
+                if pattern in col_normalized:
                     return col
         
         return None
@@ -97,6 +246,7 @@ class PortfolioAIEngine:
         """Detect all relevant columns for a data source"""
         
         detected = {}
+        column_keys = self._column_keys(df) if df is not None else []
         
         id_patterns = [
             'project_id', 'projectid', 'project id', 'project code', 'project_code',
@@ -104,16 +254,16 @@ class PortfolioAIEngine:
             'project no', 'project_no', 'projectno', 'project number', 'project_number',
             'wbs', 'wbs code', 'wbs_code'
         ]
-        detected['id'] = self._detect_column(df, id_patterns, "project ID")
+        detected['id'] = self._detect_column(df, id_patterns, "project ID", column_keys)
         
         wave_num_patterns = ['wave #', 'wave#', 'wave_#', 'wave', 'wave_number', 'wave number', '#']
-        detected['wave_num'] = self._detect_column(df, wave_num_patterns, "wave number")
+        detected['wave_num'] = self._detect_column(df, wave_num_patterns, "wave number", column_keys)
         
         name_patterns = [
             'project_name', 'project name', 'projectname', 'name',
             'project title', 'project_title', 'title', 'description'
         ]
-        name_col = self._detect_column(df, name_patterns, "project name")
+        name_col = self._detect_column(df, name_patterns, "project name", column_keys)
         if name_col and name_col != detected['id']:
             detected['name'] = name_col
         
@@ -122,7 +272,7 @@ class PortfolioAIEngine:
             'planned_start', 'planned start', 'begin_date', 'begin date',
             'project_start', 'project start', 'estimated start date', 'estimated start date of it work'
         ]
-        detected['start_date'] = self._detect_column(df, start_patterns, "start date")
+        detected['start_date'] = self._detect_column(df, start_patterns, "start date", column_keys)
         
         finish_patterns = [
             'baseline_finish', 'baseline finish', 'baseline_end', 'baseline end',
@@ -131,7 +281,7 @@ class PortfolioAIEngine:
             'project_end', 'project end', 'completion_date', 'completion date',
             'estimated end date', 'estimated end date of it work'
         ]
-        detected['finish_date'] = self._detect_column(df, finish_patterns, "finish date")
+        detected['finish_date'] = self._detect_column(df, finish_patterns, "finish date", column_keys)
         
         forecast_finish_patterns = [
             'forecast_finish', 'forecast finish', 'forecast_end', 'forecast end',
@@ -139,7 +289,7 @@ class PortfolioAIEngine:
             'projected_finish', 'projected finish', 'forecast completion', 'forecast_completion',
             'l4 forecast date', 'l4 forecast', 'l4_forecast_date'
         ]
-        detected['forecast_finish'] = self._detect_column(df, forecast_finish_patterns, "forecast finish")
+        detected['forecast_finish'] = self._detect_column(df, forecast_finish_patterns, "forecast finish", column_keys)
         
         budget_patterns = [
             'total_budget', 'total budget', 'budget', 'approved_budget', 'approved budget',
@@ -147,116 +297,119 @@ class PortfolioAIEngine:
             'total_cost', 'total cost', 'project_budget', 'project budget',
             'overall total budget', 'total overall it costs'
         ]
-        detected['budget'] = self._detect_column(df, budget_patterns, "budget")
+        detected['budget'] = self._detect_column(df, budget_patterns, "budget", column_keys)
         
         capex_patterns = ['capex', 'cap_ex', 'capital_expense', 'capital expense', 'total budget capex']
-        detected['capex'] = self._detect_column(df, capex_patterns, "capex")
+        detected['capex'] = self._detect_column(df, capex_patterns, "capex", column_keys)
         
         opex_patterns = ['opex', 'op_ex', 'operating_expense', 'operating expense', 'total budget opex']
-        detected['opex'] = self._detect_column(df, opex_patterns, "opex")
+        detected['opex'] = self._detect_column(df, opex_patterns, "opex", column_keys)
         
         eac_patterns = ['eac', 'total eac', 'estimate at completion']
-        detected['eac'] = self._detect_column(df, eac_patterns, "eac")
+        detected['eac'] = self._detect_column(df, eac_patterns, "eac", column_keys)
         
         actual_cost_patterns = [
             'actual_cost', 'actual cost', 'cost', 'amount', 'actual_amount', 'actual amount',
             'actuals', 'spent', 'expenditure', 'total_actual', 'total actual', 'total'
         ]
-        detected['actual_cost'] = self._detect_column(df, actual_cost_patterns, "actual cost")
+        detected['actual_cost'] = self._detect_column(df, actual_cost_patterns, "actual cost", column_keys)
         
         hours_patterns = [
             'planned_hours', 'planned hours', 'hours', 'effort', 'estimated_hours', 'estimated hours',
             'baseline_hours', 'baseline hours', 'total_hours', 'total hours'
         ]
-        detected['hours'] = self._detect_column(df, hours_patterns, "hours")
+        detected['hours'] = self._detect_column(df, hours_patterns, "hours", column_keys)
         
         actual_hours_patterns = [
             'actual_hours', 'actual hours', 'hours', 'worked_hours', 'worked hours',
             'time_spent', 'time spent', 'logged_hours', 'logged hours'
         ]
-        detected['actual_hours'] = self._detect_column(df, actual_hours_patterns, "actual hours")
+        detected['actual_hours'] = self._detect_column(df, actual_hours_patterns, "actual hours", column_keys)
         
         status_patterns = [
             'status', 'project_status', 'project status', 'state', 'phase',
             'current_status', 'current status', 'rag', 'rag_status', 'rag status',
             'weekly status', 'high level status'
         ]
-        detected['status'] = self._detect_column(df, status_patterns, "status")
+        detected['status'] = self._detect_column(df, status_patterns, "status", column_keys)
         
         schedule_health_patterns = [
             'schedule_health', 'schedule health', 'schedule_status', 'schedule status',
             'schedule_rag', 'schedule rag', 'timeline_status', 'timeline status'
         ]
-        detected['schedule_health'] = self._detect_column(df, schedule_health_patterns, "schedule health")
+        detected['schedule_health'] = self._detect_column(df, schedule_health_patterns, "schedule health", column_keys)
         
         budget_health_patterns = [
             'budget_health', 'budget health', 'budget_status', 'budget status',
             'budget_rag', 'budget rag', 'cost_status', 'cost status', 'financial_health'
         ]
-        detected['budget_health'] = self._detect_column(df, budget_health_patterns, "budget health")
+        detected['budget_health'] = self._detect_column(df, budget_health_patterns, "budget health", column_keys)
         
         risk_patterns = [
             'risk_level', 'risk level', 'risk', 'risk_status', 'risk status',
             'risk_rag', 'risk rag', 'overall_risk', 'overall risk', 'risk health'
         ]
-        detected['risk'] = self._detect_column(df, risk_patterns, "risk level")
+        detected['risk'] = self._detect_column(df, risk_patterns, "risk level", column_keys)
         
         snapshot_date_patterns = [
             'snapshot_date', 'snapshot date', 'report_date', 'report date',
             'as_of_date', 'as of date', 'date', 'week', 'reporting_date'
         ]
-        detected['snapshot_date'] = self._detect_column(df, snapshot_date_patterns, "snapshot date")
+        detected['snapshot_date'] = self._detect_column(df, snapshot_date_patterns, "snapshot date", column_keys)
         
         completion_patterns = [
             'completion_pct', 'completion pct', 'completion', 'percent_complete', 'percent complete',
             '% complete', 'pct_complete', 'progress', 'completion_%', 'completion %',
             'overall % complete', 'pct_complete_normalized'
         ]
-        detected['completion'] = self._detect_column(df, completion_patterns, "completion %")
+        detected['completion'] = self._detect_column(df, completion_patterns, "completion %", column_keys)
         
         stage_patterns = ['stage', 'lifecycle', 'lifecycle_stage', 'delivery_stage', 'phase', 'wave stage']
-        detected['stage'] = self._detect_column(df, stage_patterns, "stage")
+        detected['stage'] = self._detect_column(df, stage_patterns, "stage", column_keys)
         
         owner_patterns = [
             'owner', 'project_owner', 'project owner', 'manager', 'project_manager',
             'project manager', 'pm', 'responsible', 'lead', 'it project manager',
             'initiative owner', 'accountable workstream'
         ]
-        detected['owner'] = self._detect_column(df, owner_patterns, "owner")
+        detected['owner'] = self._detect_column(df, owner_patterns, "owner", column_keys)
         
         strategic_patterns = [
             'strategic_alignment', 'strategic alignment', 'strategic goal', 'strategy',
             'strategic_goal', 'priority', 'prioritization score'
         ]
-        detected['strategic_alignment'] = self._detect_column(df, strategic_patterns, "strategic alignment")
+        detected['strategic_alignment'] = self._detect_column(df, strategic_patterns, "strategic alignment", column_keys)
         
         benefit_patterns = [
             'benefit', 'benefits', 'net recurring benefits', 'one-time benefits',
             '5 yr rev impact', '5 yr cost savings', 'benefit quantification'
         ]
-        detected['benefits'] = self._detect_column(df, benefit_patterns, "benefits")
+        detected['benefits'] = self._detect_column(df, benefit_patterns, "benefits", column_keys)
         
         value_lever_patterns = [
             'value_lever', 'value lever', 'value_driver', 'value driver', 'outcome', 'business outcome'
         ]
-        detected['value_lever'] = self._detect_column(df, value_lever_patterns, "value lever")
+        detected['value_lever'] = self._detect_column(df, value_lever_patterns, "value lever", column_keys)
         
         approval_date_patterns = [
             'approval_date', 'approval date', 'approved_date', 'approved date', 'start_approval'
         ]
-        detected['approval_date'] = self._detect_column(df, approval_date_patterns, "approval date")
+        detected['approval_date'] = self._detect_column(df, approval_date_patterns, "approval date", column_keys)
         
         interdep_patterns = ['interdependencies', 'dependencies', 'project interdependencies']
-        detected['interdependencies'] = self._detect_column(df, interdep_patterns, "interdependencies")
+        detected['interdependencies'] = self._detect_column(df, interdep_patterns, "interdependencies", column_keys)
         
         complexity_patterns = ['complexity', 'it implementation complexity', 'implementation complexity']
-        detected['complexity'] = self._detect_column(df, complexity_patterns, "complexity")
+        detected['complexity'] = self._detect_column(df, complexity_patterns, "complexity", column_keys)
         
         task_patterns = ['task', 'task_name', 'task name', 'activity', 'work_item']
-        detected['task'] = self._detect_column(df, task_patterns, "task")
+        detected['task'] = self._detect_column(df, task_patterns, "task", column_keys)
         
         resource_patterns = ['resource', 'user', 'assigned_to', 'assigned to', 'team_member']
-        detected['resource'] = self._detect_column(df, resource_patterns, "resource")
+        detected['resource'] = self._detect_column(df, resource_patterns, "resource", column_keys)
+        
+        # Distinct-resource counts only trust a column literally named 'user'
+        detected['user'] = next((col for col in df.columns if str(col).lower() == 'user'), None)
         
         detected = {k: v for k, v in detected.items() if v is not None}
         
@@ -267,7 +420,7 @@ class PortfolioAIEngine:
         if isinstance(df, dict):
             df = list(df.values())[0]
         
-        self.smartsheet_data = df.copy()
+        self.smartsheet_data = df.copy(deep=False)
         self.smartsheet_cols = self._detect_columns_for_source(df, 'smartsheet')
         
         print(f"✅ Loaded Smartsheet: {len(df)} projects")
@@ -281,12 +434,26 @@ class PortfolioAIEngine:
         if other_cols:
             print(f"   📊 Key columns: {', '.join(other_cols[:4])}")
         
+        self.smartsheet_data['_norm_id'] = self._normalize_id_series(self.smartsheet_data[self.smartsheet_cols['id']])
+        self._smartsheet_idx = self.smartsheet_data.groupby('_norm_id', sort=False).indices
+        self._baseline_extractors = self._build_extractors(BASELINE_FIELDS, self.smartsheet_cols)
+        self._coerce_numeric_columns(self.smartsheet_data, self.smartsheet_cols)
+        self._coerce_date_columns(self.smartsheet_data, self.smartsheet_cols)
+        
+        health_cols = [self.smartsheet_cols.get(key) for key in ('schedule_health', 'budget_health', 'risk')]
+        status = self._classify_health_batch(*[
+            self.smartsheet_data[col] if col else pd.Series(None, index=self.smartsheet_data.index, dtype=object)
+            for col in health_cols
+        ])
+        first_rows = ~self.smartsheet_data['_norm_id'].duplicated() & self.smartsheet_data['_norm_id'].notna()
+        self._health_status = dict(zip(self.smartsheet_data.loc[first_rows, '_norm_id'], status[first_rows]))
+        
     def load_wave(self, df: pd.DataFrame):
         """Load Wave data (weekly snapshots & forecasts)"""
         if isinstance(df, dict):
             df = list(df.values())[0]
         
-        self.wave_data = df.copy()
+        self.wave_data = df.copy(deep=False)
         self.wave_cols = self._detect_columns_for_source(df, 'wave')
         
         print(f"✅ Loaded Wave: {len(df)} snapshots")
@@ -302,12 +469,34 @@ class PortfolioAIEngine:
         if other_cols:
             print(f"   📊 Key columns: {', '.join(other_cols[:4])}")
         
+        self._coerce_numeric_columns(self.wave_data, self.wave_cols)
+        self._wave_extractors = self._build_extractors(WAVE_FIELDS, self.wave_cols)
+        self._coerce_date_columns(self.wave_data, self.wave_cols)
+        
+        # Order snapshots chronologically so each project's last row is its latest
+        # (stable, so same-date rows keep file order; undated rows sort first)
+        snapshot_col = self.wave_cols.get('snapshot_date')
+        if snapshot_col and pd.api.types.is_datetime64_any_dtype(self.wave_data[snapshot_col]):
+            self.wave_data = self.wave_data.sort_values(snapshot_col, kind='stable', na_position='first')
+        
+        self._wave_by_id = {}
+        self._wave_latest = {}
+        if self.wave_cols.get('wave_num'):
+            wave_col = self.wave_cols['wave_num']
+            self.wave_data['_norm_id'] = self._normalize_id_series(self.wave_data[wave_col])
+            self._wave_by_id = dict(list(self.wave_data.groupby('_norm_id', sort=False)))
+            self._wave_latest = {norm_id: snapshots.iloc[-1] for norm_id, snapshots in self._wave_by_id.items()}
+        
+        self._wave_names = ([], [])
+        if self.wave_cols.get('name'):
+            self._wave_names = self._fuzzy_candidates(self.wave_data[self.wave_cols['name']])
+        
     def load_tick(self, df: pd.DataFrame):
         """Load Tick data (actual execution)"""
         if isinstance(df, dict):
             df = list(df.values())[0]
         
-        self.tick_data = df.copy()
+        self.tick_data = df.copy(deep=False)
         self.tick_cols = self._detect_columns_for_source(df, 'tick')
         
         print(f"✅ Loaded Tick: {len(df)} actuals")
@@ -322,12 +511,41 @@ class PortfolioAIEngine:
         other_cols = [f"{k}:'{v}'" for k, v in self.tick_cols.items() if k != 'id' and k in ['actual_cost', 'actual_hours', 'wave_num']]
         if other_cols:
             print(f"   📊 Key columns: {', '.join(other_cols[:3])}")
+        
+        self._coerce_numeric_columns(self.tick_data, self.tick_cols)
+        self._coerce_date_columns(self.tick_data, self.tick_cols)
+        
+        # A few hundred resource names repeat across every actual, so group on category codes
+        resource_col = self.tick_cols.get('resource')
+        if resource_col and resource_col not in (self.tick_cols.get('id'), self.tick_cols.get('wave_num')):
+            self.tick_data[resource_col] = self.tick_data[resource_col].astype('category')
+        
+        # Normalize project keys once here so formulas read _norm_id instead of re-normalizing
+        proj_id_col = self.tick_cols.get('wave_num') or self.tick_cols['id']
+        self.tick_data['_norm_id'] = self._normalize_id_series(self.tick_data[proj_id_col])
+        
+        self._tick_agg = None
+        if self.tick_cols.get('wave_num'):
+            self._tick_agg = self._aggregate_tick_actuals(self.tick_data, self.tick_data['_norm_id'])
+        
+        # Name-matched lookups score against the distinct Tick project names only
+        self._tick_unique_ids = None
+        self._tick_names = ([], [])
+        self._tick_gb = None
+        if not self.tick_cols.get('wave_num') and self.tick_cols.get('id'):
+            self._tick_unique_ids = self.tick_data[self.tick_cols['id']].unique()
+            self._tick_names = self._fuzzy_candidates(pd.Series(self._tick_unique_ids))
+            self._tick_gb = self.tick_data.groupby(self.tick_cols['id'], sort=False)
     
     def _normalize_project_id(self, project_id):
         """Normalize project ID for matching across systems"""
         if pd.isna(project_id):
             return None
-        return str(project_id).strip().upper()
+        return _normalize_id_cached(str(project_id))
+    
+    def _normalize_id_series(self, series: pd.Series) -> pd.Series:
+        """Vectorized _normalize_project_id over a whole column"""
+        return series.astype(str).str.strip().str.upper().where(series.notna())
     
     def _fuzzy_match_score(self, s1: str, s2: str) -> float:
         """Calculate similarity score between two strings"""
@@ -335,7 +553,45 @@ class PortfolioAIEngine:
             return 0.0
         s1 = str(s1).lower().strip()
         s2 = str(s2).lower().strip()
-        return SequenceMatcher(None, s1, s2).ratio()
+        if fuzz is not None:
+            return fuzz.ratio(s1, s2) / 100.0
+        return _similarity(s1, s2)
+    
+    def _fuzzy_candidates(self, series: pd.Series) -> Tuple[List[str], List[Any]]:
+        """Lowercase/strip candidate names once, returning (names, index labels)"""
+        names = series.dropna()
+        return names.astype(str).str.lower().str.strip().tolist(), names.index.tolist()
+    
+    def _fuzzy_matches(self, query, candidates: Tuple[List[str], List[Any]], threshold: float = 0.6, best_only: bool = False) -> List[Any]:
+        """
+        Labels of candidates scoring above threshold against query (best first).
+        Uses rapidfuzz's C scorer when installed, difflib otherwise.
+        """
+        names, labels = candidates
+        if pd.isna(query) or not names:
+            return []
+        query = str(query).lower().strip()
+        
+        if process is not None:
+            cutoff = threshold * 100
+            if best_only:
+                match = process.extractOne(query, names, scorer=fuzz.ratio, score_cutoff=cutoff)
+                return [labels[match[2]]] if match and match[1] > cutoff else []
+            matches = process.extract(query, names, scorer=fuzz.ratio, score_cutoff=cutoff, limit=None)
+            return [labels[idx] for _, score, idx in matches if score > cutoff]
+        
+        scored = []
+        for name, label in zip(names, labels):
+            # ratio() can't exceed 2*min(len)/total (difflib's real_quick_ratio); skip hopeless pairs
+            total = len(query) + len(name)
+            if total and 2.0 * min(len(query), len(name)) / total <= threshold:
+                continue
+            score = _similarity(query, name)
+            if score > threshold:
+                scored.append((score, label))
+        if best_only and scored:
+            return [max(scored, key=lambda x: x[0])[1]]
+        return [label for _, label in sorted(scored, key=lambda x: x[0], reverse=True)]
     
     def _safe_get(self, df, column, default=None):
         """Safely get column value with fallback"""
@@ -344,15 +600,81 @@ class PortfolioAIEngine:
         val = df[column].iloc[0] if len(df) > 0 else default
         return val if pd.notna(val) else default
     
+    def _coerce_numeric_columns(self, df: pd.DataFrame, cols: Dict[str, str]):
+        """Parse currency text in numeric columns once at load, in place.
+        
+        Columns that are also mapped to a non-numeric key (dates, text) are
+        left as-is and keep going through _safe_numeric's string path.
+        """
+        shared = {col for key, col in cols.items() if key not in NUMERIC_KEYS}
+        for col in dict.fromkeys(cols[key] for key in NUMERIC_KEYS if cols.get(key)):
+            if col in shared or pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            df[col] = self._parse_numeric_series(df[col])
+    
+    def _parse_numeric_series(self, series: pd.Series) -> pd.Series:
+        """Vectorized _safe_numeric: currency text to float, NaN where unparseable"""
+        if pd.api.types.is_numeric_dtype(series):
+            return series
+        cleaned = series.astype(str).str.replace(r'[,$€]', '', regex=True).str.strip()
+        return pd.to_numeric(cleaned, errors='coerce')
+    
+    def _parse_date_series(self, series: pd.Series) -> pd.Series:
+        """Vectorized _safe_date: NaT where unparseable (per-value fallback for mixed tz-aware/naive input)"""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        try:
+            return pd.to_datetime(series, errors='coerce', format='mixed', cache=True)
+        except (TypeError, ValueError):
+            return series.map(self._safe_date)
+    
+    def _coerce_date_columns(self, df: pd.DataFrame, cols: Dict[str, str]):
+        """Parse date columns once at load, in place (same sharing rule as numerics)"""
+        shared = {col for key, col in cols.items() if key not in DATE_KEYS}
+        for col in dict.fromkeys(cols[key] for key in DATE_KEYS if cols.get(key)):
+            if col in shared or pd.api.types.is_datetime64_any_dtype(df[col]):
+                continue
+            try:
+                df[col] = pd.to_datetime(df[col], errors='coerce', format='mixed', cache=True)
+            except (TypeError, ValueError):
+                # e.g. tz-aware and naive values mixed; fall back to per-value parsing
+                continue
+    
+    def _build_extractors(self, fields, cols: Dict[str, str]) -> List[Tuple[str, Any, Any, bool]]:
+        """Resolve a field schema against the detected columns: (out key, column, transform, skip None)"""
+        transforms = {
+            'date': self._safe_date_str,
+            'numeric': self._safe_numeric,
+            'value': lambda value: value if pd.notna(value) else None,
+            'text': str,
+        }
+        return [
+            (out_key, cols[col_key], transforms[kind], kind in ('numeric', 'date'))
+            for out_key, col_key, kind in fields
+            if cols.get(col_key)
+        ]
+    
+    def _extract_fields(self, row: pd.Series, extractors: List[Tuple[str, Any, Any, bool]]) -> Dict:
+        """Apply prebuilt extractors to one source row; numeric/date fields are dropped when unparseable"""
+        values = {}
+        for out_key, col, transform, skip_none in extractors:
+            value = transform(row.get(col))
+            if value is None and skip_none:
+                continue
+            values[out_key] = value
+        return values
+    
     def _safe_numeric(self, value, default=None):
         """Safely convert to numeric, return None if not available"""
+        if isinstance(value, str):
+            value = value.translate(CURRENCY_CHARS).strip()
+            if not value:
+                return None
         try:
             if pd.isna(value):
                 return None
-            if isinstance(value, str):
-                value = value.replace(',', '').replace('$', '').replace('€', '').strip()
             return float(value)
-        except:
+        except (TypeError, ValueError, OverflowError):
             return None
     
     def _safe_date(self, value):
@@ -363,9 +685,14 @@ class PortfolioAIEngine:
             if isinstance(value, (datetime, pd.Timestamp)):
                 return value
             return pd.to_datetime(value)
-        except:
+        except (TypeError, ValueError, OverflowError):
             return None
     
+    def _safe_date_str(self, value):
+        """Date as its display string, or None when missing/unparseable (never the string 'None')"""
+        date = self._safe_date(value)
+        return str(date) if date is not None else None
+    
     def _calculate_variance_pct(self, actual, baseline):
         """Calculate variance percentage - returns None if inputs invalid"""
         if baseline is None or baseline == 0 or actual is None:
@@ -374,24 +701,21 @@ class PortfolioAIEngine:
     
     def _classify_health(self, schedule_health, budget_health, risk_level):
         """Classify overall project health"""
-        health_map = {
-            'green': 3, 'yellow': 2, 'red': 1,
-            'on track': 3, 'at risk': 2, 'delayed': 1,
-            'low': 3, 'medium': 2, 'high': 1
-        }
-        
-        schedule_score = health_map.get(str(schedule_health).lower().strip(), 2) if schedule_health else 2
-        budget_score = health_map.get(str(budget_health).lower().strip(), 2) if budget_health else 2
-        risk_score = health_map.get(str(risk_level).lower().strip(), 2) if risk_level else 2
-        
-        avg_score = (schedule_score + budget_score + risk_score) / 3
-        
-        if avg_score >= 2.5:
-            return "On Track"
-        elif avg_score >= 1.5:
-            return "At Risk"
-        else:
-            return "Delayed"
+        return _classify_health_cached(
+            str(schedule_health).lower().strip() if schedule_health else '',
+            str(budget_health).lower().strip() if budget_health else '',
+            str(risk_level).lower().strip() if risk_level else ''
+        )
+    
+    def _classify_health_batch(self, schedule_s: pd.Series, budget_s: pd.Series, risk_s: pd.Series) -> pd.Series:
+        """Vectorized _classify_health over whole health columns"""
+        def scores(s):
+            return s.astype(str).str.lower().str.strip().map(HEALTH_SCORES).fillna(2)
+        
+        avg_score = (scores(schedule_s) + scores(budget_s) + scores(risk_s)) / 3
+        status = pd.cut(avg_score, [-np.inf, 1.5, 2.5, np.inf], right=False,
+                        labels=['Delayed', 'At Risk', 'On Track'])
+        return status.astype(object)
     
     def _get_latest_wave_snapshot(self, project_id):
         """Get most recent Wave snapshot for project"""
@@ -399,28 +723,14 @@ class PortfolioAIEngine:
             return None
         
         if self.wave_cols.get('wave_num'):
-            wave_col = self.wave_cols['wave_num']
-            project_waves = self.wave_data[
-                self.wave_data[wave_col].apply(self._normalize_project_id) == 
-                self._normalize_project_id(project_id)
-            ]
-            
-            if len(project_waves) > 0:
-                return project_waves.iloc[-1]
+            latest = self._wave_latest.get(self._normalize_project_id(project_id))
+            if latest is not None:
+                return latest
         
         if self.wave_cols.get('name'):
-            name_col = self.wave_cols['name']
-            best_match_idx = None
-            best_score = 0.6
-            
-            for idx, wave_name in self.wave_data[name_col].items():
-                score = self._fuzzy_match_score(project_id, wave_name)
-                if score > best_score:
-                    best_score = score
-                    best_match_idx = idx
-            
-            if best_match_idx is not None:
-                return self.wave_data.loc[best_match_idx]
+            best_match = self._fuzzy_matches(project_id, self._wave_names, best_only=True)
+            if best_match:
+                return self.wave_data.loc[best_match[0]]
         
         return None
     
@@ -430,15 +740,11 @@ class PortfolioAIEngine:
             return None
         
         if self.wave_cols.get('wave_num'):
-            wave_col = self.wave_cols['wave_num']
-            project_waves = self.wave_data[
-                self.wave_data[wave_col].apply(self._normalize_project_id) == 
-                self._normalize_project_id(project_id)
-            ]
+            project_waves = self._wave_by_id.get(self._normalize_project_id(project_id))
         else:
             return None
         
-        if len(project_waves) < 2:
+        if project_waves is None or len(project_waves) < 2:
             return None
         
         trends = {
@@ -448,37 +754,90 @@ class PortfolioAIEngine:
         
         if self.wave_cols.get('status'):
             status_col = self.wave_cols['status']
-            status_changes = project_waves[status_col].value_counts().to_dict()
-            trends['status_distribution'] = status_changes
-            
-            statuses = project_waves[status_col].astype(str).str.lower().tolist()
-            if len(statuses) >= 2:
-                if 'red' in statuses[-2:] or 'delayed' in statuses[-2:]:
+            # One factorize pass feeds both the counts (value_counts order) and the recent-status check
+            codes, uniques = pd.factorize(project_waves[status_col])
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            order = np.argsort(-counts, kind='stable')
+            trends['status_distribution'] = {uniques[i]: int(counts[i]) for i in order}
+            
+            if len(codes) >= 2:
+                recent = {str(uniques[code]).lower() for code in codes[-2:] if code >= 0}
+                if 'red' in recent or 'delayed' in recent:
                     trends['recent_deterioration'] = True
         
         return trends
     
+    def _aggregate_tick_actuals(self, ticks: pd.DataFrame, keys) -> pd.DataFrame:
+        """Aggregate Tick actuals per project key in a single groupby pass"""
+        grouped = ticks.groupby(keys, sort=False)
+        agg = pd.DataFrame({'transaction_count': grouped.size()})
+        
+        hours_col = self.tick_cols.get('actual_hours') or self.tick_cols.get('hours')
+        if hours_col:
+            agg['total_hours'] = grouped[hours_col].sum()
+        
+        if self.tick_cols.get('actual_cost'):
+            agg['total_cost'] = grouped[self.tick_cols['actual_cost']].sum()
+        
+        if self.tick_cols.get('user'):
+            agg['unique_resources'] = grouped[self.tick_cols['user']].nunique()
+        
+        # First date column with valid dates wins, per project
+        date_cols = list(dict.fromkeys(v for k, v in self.tick_cols.items() if 'date' in k.lower()))
+        for col in date_cols:
+            date_grouped = pd.to_datetime(ticks[col], errors='coerce').groupby(keys, sort=False)
+            starts, ends = date_grouped.min(), date_grouped.max()
+            if 'work_start' in agg:
+                missing = agg['work_start'].isna()
+                agg.loc[missing, 'work_start'] = starts
+                agg.loc[missing, 'work_end'] = ends
+            else:
+                agg['work_start'] = starts
+                agg['work_end'] = ends
+        
+        if 'work_start' in agg:
+            agg['work_span_days'] = (agg['work_end'] - agg['work_start']).dt.days
+        
+        return agg
+    
+    def _actuals_from_aggregate(self, row: pd.Series) -> Dict:
+        """Convert one row of the Tick aggregate table into an actuals summary"""
+        actuals = {
+            'transaction_count': int(row['transaction_count'])
+        }
+        
+        if 'total_hours' in row.index:
+            actuals['total_hours'] = float(row['total_hours'])
+        
+        if 'total_cost' in row.index:
+            actuals['total_cost'] = float(row['total_cost'])
+        
+        if 'unique_resources' in row.index:
+            actuals['unique_resources'] = int(row['unique_resources'])
+        
+        if 'work_start' in row.index and pd.notna(row['work_start']):
+            actuals['work_start_date'] = str(row['work_start'].date())
+            actuals['work_end_date'] = str(row['work_end'].date())
+            actuals['work_span_days'] = int(row['work_span_days'])
+        
+        return actuals
+    
     def _get_tick_actuals(self, project_id):
         """Get aggregated Tick actuals for project"""
         if self.tick_data is None:
             return None
         
         if self.tick_cols.get('wave_num'):
-            wave_col = self.tick_cols['wave_num']
-            project_ticks = self.tick_data[
-                self.tick_data[wave_col].apply(self._normalize_project_id) == 
-                self._normalize_project_id(project_id)
-            ]
+            try:
+                row = self._tick_agg.loc[self._normalize_project_id(project_id)]
+            except KeyError:
+                return None
+            return self._actuals_from_aggregate(row)
         elif self.tick_cols.get('id'):
-            id_col = self.tick_cols['id']
-            best_matches = []
-            for proj_name in self.tick_data[id_col].unique():
-                score = self._fuzzy_match_score(project_id, proj_name)
-                if score > 0.6:
-                    best_matches.append(proj_name)
+            best_matches = self._tick_unique_ids[self._fuzzy_matches(project_id, self._tick_names)]
             
-            if best_matches:
-                project_ticks = self.tick_data[self.tick_data[id_col].isin(best_matches)]
+            if len(best_matches):
+                project_ticks = pd.concat([self._tick_gb.get_group(name) for name in best_matches])
             else:
                 return None
         else:
@@ -487,40 +846,8 @@ class PortfolioAIEngine:
         if len(project_ticks) == 0:
             return None
         
-        actuals = {
-            'transaction_count': len(project_ticks)
-        }
-        
-        if self.tick_cols.get('actual_hours'):
-            hours_col = self.tick_cols['actual_hours']
-            total_hours = project_ticks[hours_col].fillna(0).sum()
-            actuals['total_hours'] = float(total_hours)
-        elif self.tick_cols.get('hours'):
-            hours_col = self.tick_cols['hours']
-            total_hours = project_ticks[hours_col].fillna(0).sum()
-            actuals['total_hours'] = float(total_hours)
-        
-        if self.tick_cols.get('actual_cost'):
-            cost_col = self.tick_cols['actual_cost']
-            total_cost = project_ticks[cost_col].fillna(0).sum()
-            actuals['total_cost'] = float(total_cost)
-        
-        if 'user' in [c.lower() for c in project_ticks.columns]:
-            user_col = [c for c in project_ticks.columns if c.lower() == 'user'][0]
-            actuals['unique_resources'] = project_ticks[user_col].nunique()
-        
-        date_cols = [v for k, v in self.tick_cols.items() if 'date' in k.lower()]
-        if date_cols:
-            for col in date_cols:
-                if col in project_ticks.columns:
-                    dates = pd.to_datetime(project_ticks[col], errors='coerce').dropna()
-                    if len(dates) > 0:
-                        actuals['work_start_date'] = str(dates.min().date())
-                        actuals['work_end_date'] = str(dates.max().date())
-                        actuals['work_span_days'] = (dates.max() - dates.min()).days
-                        break
-        
-        return actuals
+        agg = self._aggregate_tick_actuals(project_ticks, np.zeros(len(project_ticks), dtype=int))
+        return self._actuals_from_aggregate(agg.iloc[0])
     
     def _evaluate_consistency_rules(self, project_data: Dict) -> List[Dict]:
         """Evaluate cross-source consistency rules"""
@@ -530,14 +857,16 @@ class PortfolioAIEngine:
         wave = project_data.get('latest_wave_snapshot', {})
         actuals = project_data.get('actuals_summary', {})
         derived = project_data.get('derived_metrics', {})
+        project_id = project_data['project_metadata']['project_id']
         
         if wave:
-            status = str(wave.get('status', '')).lower()
+            status = self._status_lc[project_id]
             cost_variance = derived.get('cost_variance_pct')
             if ('green' in status or 'on track' in status) and cost_variance and cost_variance < -10:
                 rules_violated.append({
                     'rule': 'status_cost_mismatch',
                     'severity': 'warning',
+                    'severity_code': Severity.WARNING,
                     'description': f"Status is '{wave.get('status')}' but cost variance is {cost_variance:.1f}%",
                     'recommendation': 'Review status accuracy or investigate cost drivers'
                 })
@@ -553,27 +882,30 @@ class PortfolioAIEngine:
                     rules_violated.append({
                         'rule': 'burn_rate_overrun',
                         'severity': 'critical',
+                        'severity_code': Severity.CRITICAL,
                         'description': f"Current burn rate projects {projected_total/1000:.0f}K total cost vs {baseline_budget/1000:.0f}K budget",
                         'recommendation': 'Immediate budget review required'
                     })
         
         schedule_variance = derived.get('schedule_variance_days')
         if schedule_variance and schedule_variance > 30:
-            schedule_health = baseline.get('schedule_health', '').lower() if baseline.get('schedule_health') else ''
+            schedule_health = self._schedule_health_lc[project_id]
             if 'green' in schedule_health or 'on track' in schedule_health:
                 rules_violated.append({
                     'rule': 'schedule_health_mismatch',
                     'severity': 'warning',
+                    'severity_code': Severity.WARNING,
                     'description': f"Schedule delayed {schedule_variance} days but health shows '{baseline.get('schedule_health')}'",
                     'recommendation': 'Update schedule health indicator'
                 })
         
         if wave and not actuals:
-            status = str(wave.get('status', '')).lower()
+            status = self._status_lc[project_id]
             if 'active' in status or 'in progress' in status or 'green' in status:
                 rules_violated.append({
                     'rule': 'missing_actuals',
                     'severity': 'info',
+                    'severity_code': Severity.INFO,
                     'description': 'Project marked active but no execution data found',
                     'recommendation': 'Verify project has started or update status'
                 })
@@ -589,6 +921,7 @@ class PortfolioAIEngine:
                     rules_violated.append({
                         'rule': 'completion_effort_mismatch',
                         'severity': 'warning',
+                        'severity_code': Severity.WARNING,
                         'description': f"Reported {completion:.0f}% complete but hours suggest {implied_completion:.0f}%",
                         'recommendation': 'Reconcile completion % with actual effort'
                     })
@@ -650,11 +983,13 @@ class PortfolioAIEngine:
             'timestamp': datetime.now().isoformat()
         }
         
-        status = self._classify_health(
-            baseline.get('schedule_health'),
-            baseline.get('budget_health'),
-            baseline.get('risk_level')
-        )
+        status = self._health_status.get(self._normalize_project_id(metadata.get('project_id')))
+        if status is None:
+            status = self._classify_health(
+                baseline.get('schedule_health'),
+                baseline.get('budget_health'),
+                baseline.get('risk_level')
+            )
         
         data_completeness = 0
         if baseline: data_completeness += 1
@@ -708,10 +1043,7 @@ class PortfolioAIEngine:
         
         assessment['cross_source_observations'] = observations if observations else ['Single source data - limited cross-validation']
         
-        risks = []
-        for rule in rules:
-            if rule['severity'] in ['critical', 'warning']:
-                risks.append(f"[{rule['severity'].upper()}] {rule['description']}")
+        risks = [f"[{rule['severity'].upper()}] {rule['description']}" for rule in rules if rule['severity_code'] >= Severity.WARNING]
         
         assessment['risks_warnings'] = risks if risks else ['No significant risks detected']
         
@@ -745,12 +1077,9 @@ class PortfolioAIEngine:
         
         assessment['data_gaps'] = gaps if gaps else ['Complete data from all three sources']
         
-        recommendations = []
-        for rule in rules:
-            if rule.get('recommendation'):
-                recommendations.append(rule['recommendation'])
+        recommendations = list(islice((rule['recommendation'] for rule in rules if rule.get('recommendation')), 3))
         
-        assessment['recommendations'] = recommendations[:3] if recommendations else ['Continue monitoring with current data']
+        assessment['recommendations'] = recommendations if recommendations else ['Continue monitoring with current data']
         
         return assessment
     
@@ -758,7 +1087,7 @@ class PortfolioAIEngine:
         """Generate 2-3 sentence executive summary"""
         parts = []
         
-        parts.append(f"Project classified as '{status}' based on cross-source analysis.")
+        parts.append(STATUS_SUMMARY.get(status) or f"Project classified as '{status}' based on cross-source analysis.")
         
         cost_var = derived.get('cost_variance_pct')
         schedule_var = derived.get('schedule_variance_days')
@@ -773,7 +1102,7 @@ class PortfolioAIEngine:
             else:
                 parts.append("Limited execution data available for detailed analysis.")
         
-        critical_rules = [r for r in rules if r['severity'] == 'critical']
+        critical_rules = [r for r in rules if r['severity_code'] == Severity.CRITICAL]
         if critical_rules:
             parts.append(f"Critical issue: {critical_rules[0]['description']}")
         
@@ -785,7 +1114,7 @@ class PortfolioAIEngine:
         Returns structured assessment with evidence-based insights
         """
         
-        print(f"\n🔍 Analyzing Project: {project_id}")
+        logger.info(f"\n🔍 Analyzing Project: {project_id}")
         
         project_data = {
             'project_metadata': {
@@ -801,13 +1130,11 @@ class PortfolioAIEngine:
         }
         
         if self.smartsheet_data is not None and self.smartsheet_cols.get('id'):
-            id_col = self.smartsheet_cols['id']
-            project_smartsheet = self.smartsheet_data[
-                self.smartsheet_data[id_col].apply(self._normalize_project_id) == 
-                self._normalize_project_id(project_id)
-            ]
+            positions = self._smartsheet_idx.get(self._normalize_project_id(project_id))
             
-            if len(project_smartsheet) > 0:
+            if positions is not None:
+                # Slice (not mask) the first matching row: no per-column take over the wide sheet
+                project_smartsheet = self.smartsheet_data.iloc[positions[0]:positions[0] + 1]
                 row = project_smartsheet.iloc[0]
                 
                 if self.smartsheet_cols.get('name'):
@@ -815,127 +1142,33 @@ class PortfolioAIEngine:
                 else:
                     project_data['project_metadata']['project_name'] = project_id
                 
-                baseline_metrics = {}
-                
-                if self.smartsheet_cols.get('start_date'):
-                    baseline_metrics['baseline_start'] = str(self._safe_date(row.get(self.smartsheet_cols['start_date'])))
-                
-                if self.smartsheet_cols.get('finish_date'):
-                    baseline_metrics['baseline_finish'] = str(self._safe_date(row.get(self.smartsheet_cols['finish_date'])))
-                
-                if self.smartsheet_cols.get('budget'):
-                    budget_val = self._safe_numeric(row.get(self.smartsheet_cols['budget']))
-                    if budget_val is not None:
-                        baseline_metrics['total_budget'] = budget_val
-                
-                if self.smartsheet_cols.get('capex'):
-                    capex_val = self._safe_numeric(row.get(self.smartsheet_cols['capex']))
-                    if capex_val is not None:
-                        baseline_metrics['capex'] = capex_val
-                
-                if self.smartsheet_cols.get('opex'):
-                    opex_val = self._safe_numeric(row.get(self.smartsheet_cols['opex']))
-                    if opex_val is not None:
-                        baseline_metrics['opex'] = opex_val
-                
-                if self.smartsheet_cols.get('eac'):
-                    eac_val = self._safe_numeric(row.get(self.smartsheet_cols['eac']))
-                    if eac_val is not None:
-                        baseline_metrics['eac'] = eac_val
-                
-                if self.smartsheet_cols.get('hours'):
-                    hours_val = self._safe_numeric(row.get(self.smartsheet_cols['hours']))
-                    if hours_val is not None:
-                        baseline_metrics['planned_hours'] = hours_val
-                
-                if self.smartsheet_cols.get('schedule_health'):
-                    baseline_metrics['schedule_health'] = self._safe_get(project_smartsheet, self.smartsheet_cols['schedule_health'])
-                
-                if self.smartsheet_cols.get('budget_health'):
-                    baseline_metrics['budget_health'] = self._safe_get(project_smartsheet, self.smartsheet_cols['budget_health'])
-                
-                if self.smartsheet_cols.get('risk'):
-                    baseline_metrics['risk_level'] = self._safe_get(project_smartsheet, self.smartsheet_cols['risk'])
-                
-                if self.smartsheet_cols.get('owner'):
-                    baseline_metrics['owner'] = self._safe_get(project_smartsheet, self.smartsheet_cols['owner'])
-                
-                if self.smartsheet_cols.get('strategic_alignment'):
-                    baseline_metrics['strategic_alignment'] = self._safe_get(project_smartsheet, self.smartsheet_cols['strategic_alignment'])
-                
-                if self.smartsheet_cols.get('benefits'):
-                    baseline_metrics['benefits'] = self._safe_get(project_smartsheet, self.smartsheet_cols['benefits'])
-                
-                if self.smartsheet_cols.get('completion'):
-                    completion_val = self._safe_numeric(row.get(self.smartsheet_cols['completion']))
-                    if completion_val is not None:
-                        baseline_metrics['completion_pct'] = completion_val
-                
-                if self.smartsheet_cols.get('stage'):
-                    baseline_metrics['stage'] = self._safe_get(project_smartsheet, self.smartsheet_cols['stage'])
-                
-                if self.smartsheet_cols.get('interdependencies'):
-                    baseline_metrics['interdependencies'] = self._safe_get(project_smartsheet, self.smartsheet_cols['interdependencies'])
+                baseline_metrics = self._extract_fields(row, self._baseline_extractors)
                 
                 project_data['baseline_metrics'] = baseline_metrics
-                print(f"  ✓ Smartsheet baseline loaded")
+                logger.info(f"  ✓ Smartsheet baseline loaded")
             else:
-                print(f"  ⚠️  No Smartsheet data found")
+                logger.info(f"  ⚠️  No Smartsheet data found")
         
         latest_wave = self._get_latest_wave_snapshot(project_id)
         if latest_wave is not None:
-            wave_snapshot = {}
-            
-            if self.wave_cols.get('snapshot_date'):
-                wave_snapshot['snapshot_date'] = str(self._safe_date(latest_wave.get(self.wave_cols['snapshot_date'])))
-            
-            if self.wave_cols.get('status'):
-                wave_snapshot['status'] = str(latest_wave.get(self.wave_cols['status']))
-            
-            if self.wave_cols.get('stage'):
-                wave_snapshot['stage'] = str(latest_wave.get(self.wave_cols['stage']))
-            
-            if self.wave_cols.get('forecast_finish'):
-                wave_snapshot['forecast_finish'] = str(self._safe_date(latest_wave.get(self.wave_cols['forecast_finish'])))
-            
-            if self.wave_cols.get('completion'):
-                completion_val = self._safe_numeric(latest_wave.get(self.wave_cols['completion']))
-                if completion_val is not None:
-                    wave_snapshot['completion_pct'] = completion_val
-            
-            if self.wave_cols.get('complexity'):
-                wave_snapshot['complexity'] = str(latest_wave.get(self.wave_cols['complexity']))
-            
-            if self.wave_cols.get('owner'):
-                wave_snapshot['owner'] = str(latest_wave.get(self.wave_cols['owner']))
-            
-            if self.wave_cols.get('budget'):
-                budget_val = self._safe_numeric(latest_wave.get(self.wave_cols['budget']))
-                if budget_val is not None:
-                    wave_snapshot['budget'] = budget_val
-            
-            if self.wave_cols.get('value_lever'):
-                wave_snapshot['value_lever'] = str(latest_wave.get(self.wave_cols['value_lever']))
-            
-            if self.wave_cols.get('approval_date'):
-                wave_snapshot['approval_date'] = str(self._safe_date(latest_wave.get(self.wave_cols['approval_date'])))
+            wave_snapshot = self._extract_fields(latest_wave, self._wave_extractors)
             
             project_data['latest_wave_snapshot'] = wave_snapshot
-            print(f"  ✓ Wave snapshot loaded")
+            logger.info(f"  ✓ Wave snapshot loaded")
         else:
-            print(f"  ⚠️  No Wave data found")
+            logger.info(f"  ⚠️  No Wave data found")
         
         wave_trends = self._get_wave_trends(project_id)
         if wave_trends:
             project_data['wave_trends'] = wave_trends
-            print(f"  ✓ Wave trends analyzed ({wave_trends.get('snapshot_count', 0)} snapshots)")
+            logger.info(f"  ✓ Wave trends analyzed ({wave_trends.get('snapshot_count', 0)} snapshots)")
         
         tick_actuals = self._get_tick_actuals(project_id)
         if tick_actuals:
             project_data['actuals_summary'] = tick_actuals
-            print(f"  ✓ Tick actuals loaded ({tick_actuals.get('transaction_count', 0)} transactions)")
+            logger.info(f"  ✓ Tick actuals loaded ({tick_actuals.get('transaction_count', 0)} transactions)")
         else:
-            print(f"  ⚠️  No Tick data found")
+            logger.info(f"  ⚠️  No Tick data found")
         
         derived_metrics = self._calculate_derived_metrics(
             project_data['baseline_metrics'],
@@ -943,19 +1176,27 @@ class PortfolioAIEngine:
             project_data['actuals_summary']
         )
         project_data['derived_metrics'] = derived_metrics
-        print(f"  ✓ Derived metrics calculated")
+        logger.info(f"  ✓ Derived metrics calculated")
+        
+        # Lowercased labels for the rules and formulas, kept off the public project dicts
+        schedule_health = project_data['baseline_metrics'].get('schedule_health')
+        self._schedule_health_lc[project_id] = schedule_health.lower() if isinstance(schedule_health, str) else ''
+        self._status_lc[project_id] = str(project_data['latest_wave_snapshot'].get('status', '')).lower()
         
         rule_violations = self._evaluate_consistency_rules(project_data)
         project_data['rule_evaluations'] = rule_violations
         if rule_violations:
-            print(f"  ⚠️  {len(rule_violations)} consistency rules triggered")
+            logger.info(f"  ⚠️  {len(rule_violations)} consistency rules triggered")
         
         assessment = self._generate_project_assessment(project_data)
         project_data['assessment'] = assessment
         
-        print(f"✅ Analysis complete for {project_id}")
+        logger.info(f"✅ Analysis complete for {project_id}")
         
         self.projects[project_id] = project_data
+        self._project_names[project_id] = project_data['project_metadata'].get('project_name') or project_id
+        if self._is_valid_project_id(project_id):
+            self._valid_project_ids.add(project_id)
         
         return project_data
     
@@ -969,44 +1210,71 @@ class PortfolioAIEngine:
         project_ids = set()
         
         if self.smartsheet_data is not None and self.smartsheet_cols.get('id'):
-            id_col = self.smartsheet_cols['id']
-            project_ids.update(
-                self.smartsheet_data[id_col].apply(self._normalize_project_id).dropna().unique()
-            )
+            project_ids.update(self._smartsheet_idx)
         
         if self.smartsheet_data is not None and self.smartsheet_cols.get('wave_num'):
-            wave_col = self.smartsheet_cols['wave_num']
-            wave_ids = self.smartsheet_data[wave_col].apply(self._normalize_project_id).dropna().unique()
-            project_ids.update(wave_ids)
+            # Normalize the distinct raw values only, not every row
+            raw_ids = pd.Series(self.smartsheet_data[self.smartsheet_cols['wave_num']].dropna().unique())
+            project_ids.update(self._normalize_id_series(raw_ids).dropna())
         
         if self.wave_data is not None and self.wave_cols.get('wave_num'):
-            wave_col = self.wave_cols['wave_num']
-            project_ids.update(
-                self.wave_data[wave_col].apply(self._normalize_project_id).dropna().unique()
-            )
+            project_ids.update(self._wave_by_id)
         
         if self.tick_data is not None and self.tick_cols.get('wave_num'):
-            wave_col = self.tick_cols['wave_num']
-            tick_waves = self.tick_data[wave_col].apply(self._normalize_project_id).dropna().unique()
-            tick_waves = [w for w in tick_waves if w != 'NOT SPECIFIED']
-            project_ids.update(tick_waves)
+            project_ids.update(set(self._tick_agg.index) - {'NOT SPECIFIED'})
         
         project_ids = sorted(list(project_ids))
         
         print(f"\n📊 Found {len(project_ids)} unique projects across all sources")
         
-        for project_id in project_ids:
-            try:
-                self.analyze_project(project_id)
-            except Exception as e:
-                print(f"❌ Error analyzing {project_id}: {str(e)}")
-                import traceback
-                traceback.print_exc()
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        if not self.verbose:
+            handler = logging.handlers.MemoryHandler(capacity=10_000, flushLevel=logging.ERROR, target=handler)
+        logger.addHandler(handler)
+        
+        try:
+            for project_id in project_ids:
+                try:
+                    self.analyze_project(project_id)
+                except Exception as e:
+                    logger.exception(f"❌ Error analyzing {project_id}: {str(e)}")
+        finally:
+            handler.flush()
+            logger.removeHandler(handler)
         
         print(f"\n✅ Portfolio analysis complete: {len(self.projects)} projects analyzed")
         
         return self.projects
     
+    def _summary_record(self, project_id: str, project_data: Dict) -> Dict:
+        """Flatten the fields get_portfolio_summary tallies for one project"""
+        overall = project_data.get('assessment', {}).get('overall_assessment', {})
+        derived = project_data.get('derived_metrics', {})
+        
+        critical_issues = [
+            {
+                'project_id': project_id,
+                'project_name': self._project_names[project_id],
+                'issue': rule['description'],
+                'recommendation': rule['recommendation']
+            }
+            for rule in project_data.get('rule_evaluations', [])
+            if rule['severity_code'] == Severity.CRITICAL
+        ]
+        
+        return {
+            'status': overall.get('status', 'Unknown'),
+            'health': overall.get('health', 'Unknown'),
+            'confidence': overall.get('confidence_level', 'Unknown'),
+            'data_sources': overall.get('data_sources_available', 0),
+            'budget': project_data.get('baseline_metrics', {}).get('total_budget') or 0,
+            'actuals': project_data.get('actuals_summary', {}).get('total_cost') or 0,
+            'overrun': bool(derived.get('budget_overrun')),
+            'delayed': derived.get('schedule_variance_days', 0) > 0,
+            'critical_issues': critical_issues
+        }
+    
     def get_portfolio_summary(self) -> Dict:
         """Generate portfolio-level summary and insights"""
         
@@ -1018,69 +1286,33 @@ class PortfolioAIEngine:
                 'total_projects': len(self.projects),
                 'analysis_timestamp': datetime.now().isoformat()
             },
-            'status_distribution': defaultdict(int),
-            'health_distribution': defaultdict(int),
-            'confidence_distribution': defaultdict(int),
-            'data_completeness': {
-                'full_data': 0,
-                'partial_data': 0,
-                'minimal_data': 0
-            },
             'critical_issues': [],
             'portfolio_risks': [],
             'top_concerns': []
         }
         
-        total_budget = 0
-        total_actuals = 0
-        total_overruns = 0
-        projects_with_delays = 0
+        # One row per project; object dtype keeps labels (incl. None) exactly as reported
+        records = pd.DataFrame([self._summary_record(pid, p) for pid, p in self.projects.items()], dtype=object)
         
-        for project_id, project_data in self.projects.items():
-            assessment = project_data.get('assessment', {})
-            overall = assessment.get('overall_assessment', {})
-            
-            status = overall.get('status', 'Unknown')
-            summary['status_distribution'][status] += 1
-            
-            health = overall.get('health', 'Unknown')
-            summary['health_distribution'][health] += 1
-            
-            confidence = overall.get('confidence_level', 'Unknown')
-            summary['confidence_distribution'][confidence] += 1
-            
-            data_sources = overall.get('data_sources_available', 0)
-            if data_sources == 3:
-                summary['data_completeness']['full_data'] += 1
-            elif data_sources == 2:
-                summary['data_completeness']['partial_data'] += 1
-            else:
-                summary['data_completeness']['minimal_data'] += 1
-            
-            baseline = project_data.get('baseline_metrics', {})
-            actuals = project_data.get('actuals_summary', {})
-            derived = project_data.get('derived_metrics', {})
-            
-            if baseline.get('total_budget'):
-                total_budget += baseline['total_budget']
-            if actuals.get('total_cost'):
-                total_actuals += actuals['total_cost']
-            
-            if derived.get('budget_overrun'):
-                total_overruns += 1
-            
-            if derived.get('schedule_variance_days', 0) > 0:
-                projects_with_delays += 1
-            
-            rules = project_data.get('rule_evaluations', [])
-            for rule in rules:
-                if rule['severity'] == 'critical':
-                    summary['critical_issues'].append({
-                        'project_id': project_id,
-                        'project_name': project_data['project_metadata'].get('project_name'),
-                        'issue': rule['description'],
-                        'recommendation': rule['recommendation']
-                    })
+        # Counter tallies in C and keeps first-seen key order for the charts
+        summary['status_distribution'] = Counter(records['status'])
+        summary['health_distribution'] = Counter(records['health'])
+        summary['confidence_distribution'] = Counter(records['confidence'])
+        
+        full_data = int((records['data_sources'] == 3).sum())
+        partial_data = int((records['data_sources'] == 2).sum())
+        summary['data_completeness'] = {
+            'full_data': full_data,
+            'partial_data': partial_data,
+            'minimal_data': len(records) - full_data - partial_data
+        }
+        
+        total_budget = float(records['budget'].astype(float).sum())
+        total_actuals = float(records['actuals'].astype(float).sum())
+        total_overruns = int(records['overrun'].sum())
+        projects_with_delays = int(records['delayed'].sum())
+        
+        summary['critical_issues'] = [issue for issues in records['critical_issues'] for issue in issues]
         
         summary['portfolio_metrics'] = {
             'total_baseline_budget': total_budget,
@@ -1127,6 +1359,104 @@ class PortfolioAIEngine:
         self.portfolio_insights = summary
         return summary
     
+    def _materialize_columns(self):
+        """Project self.projects once into parallel per-project arrays (NaN for missing numbers) for the insight formulas"""
+        labels, numbers, flags, dates = [], [], [], []
+        for proj_id, proj_data in self.projects.items():
+            actuals = proj_data.get('actuals_summary') or {}
+            baseline = proj_data.get('baseline_metrics') or {}
+            wave = proj_data.get('latest_wave_snapshot') or {}
+            derived = proj_data.get('derived_metrics') or {}
+            trends = proj_data.get('wave_trends') or {}
+            labels.append((
+                proj_id,
+                self._project_names[proj_id],
+                baseline.get('owner'),
+                wave.get('value_lever'),
+                baseline.get('schedule_health'),
+                self._schedule_health_lc[proj_id],
+                baseline.get('interdependencies'),
+            ))
+            numbers.append((
+                actuals.get('total_hours'),
+                actuals.get('total_cost'),
+                derived.get('completion_pct'),
+                baseline.get('completion_pct'),
+                derived.get('daily_burn_rate'),
+                derived.get('remaining_budget'),
+                actuals.get('work_span_days'),
+                baseline.get('planned_hours'),
+                actuals.get('unique_resources'),
+                derived.get('schedule_variance_days'),
+            ))
+            flags.append((
+                bool(derived.get('budget_overrun')),
+                bool(trends.get('recent_deterioration')),
+                bool(baseline),
+                bool(wave),
+            ))
+            dates.append((baseline.get('baseline_start'), wave.get('approval_date')))
+        
+        (self._col_project_id, self._col_project_name, self._col_owner, self._col_value_lever,
+         self._col_schedule_health, self._col_schedule_health_lc,
+         self._col_interdependencies) = _transpose(labels, 7, object)
+        (self._col_effort_hours, self._col_total_cost, self._col_completion_pct,
+         self._col_baseline_completion_pct, self._col_burn_rate, self._col_remaining_budget,
+         self._col_work_span, self._col_planned_hours, self._col_unique_resources,
+         self._col_schedule_variance) = _transpose(numbers, 10, float)
+        (self._col_budget_overrun, self._col_recent_deterioration,
+         self._col_has_smartsheet, self._col_has_wave) = _transpose(flags, 4, bool)
+        
+        # Extracted dates are str(Timestamp) values; parse each column in one batch, NaT where missing.
+        # utc=True keeps a mix of tz-aware and naive values from raising (naive ones are taken as UTC)
+        self._col_baseline_start, self._col_approval_date = (
+            pd.to_datetime(pd.Series(col, dtype=object), errors='coerce', format='ISO8601', utc=True)
+            .dt.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+            for col in _transpose(dates, 2, object))
+        
+        # A lever counts only if it is non-blank and not the literal 'none'
+        levers = pd.Series(self._col_value_lever, dtype=object)
+        lever_text = levers.astype(str)
+        self._col_has_value = (levers.astype(bool) & levers.notna()
+                               & (lever_text.str.strip() != '') & (lever_text.str.lower() != 'none')).to_numpy(dtype=bool)
+        
+        self._col_has_dependencies = np.fromiter((bool(d) for d in self._col_interdependencies),
+                                                 dtype=bool, count=len(labels))
+        self._valid_mask = np.fromiter((pid in self._valid_project_ids for pid in self._col_project_id),
+                                       dtype=bool, count=len(labels))
+        self._valid_projects = [(pid, self.projects[pid]) for pid in self._col_project_id[self._valid_mask]]
+    
+    def _project_records(self, positions: np.ndarray, **fields) -> List[Dict]:
+        """Per-project insight rows: id and name at each column position, followed by the given per-position values"""
+        keys = list(fields)
+        return [
+            {'project_id': self._col_project_id[pos], 'project_name': self._col_project_name[pos], **dict(zip(keys, values))}
+            for pos, *values in zip(positions, *fields.values())
+        ]
+    
+    def _make_insight(self, category: str, title: str, severity: str, description: str, impact: str,
+                      recommendation: str, metrics: Dict, formula_used: str, data_sources_used: List[str],
+                      project_id: Optional[str] = None, confidence: str = 'High') -> Dict:
+        """Insight record in the shape the persona lists and the UI read"""
+        return {
+            'category': category,
+            'title': title,
+            'severity': severity,
+            'description': description,
+            'impact': impact,
+            'recommendation': recommendation,
+            'metrics': metrics,
+            'formula_used': formula_used,
+            'data_sources_used': data_sources_used,
+            'project_id': project_id,
+            'confidence': confidence
+        }
+    
+    def _promote(self, insight: Dict, *tiers: List[Dict]):
+        """Publish one insight to several persona lists (shared, not copied)"""
+        for tier in tiers:
+            tier.append(insight)
+    
     def generate_all_insights(self):
         """Generate all formula-based insights with persona mapping"""
         print("\n" + "="*60)
@@ -1137,6 +1467,8 @@ class PortfolioAIEngine:
         self.vp_insights = []
         self.manager_insights = []
         
+        self._materialize_columns()
+        
         # TIER-1: Board-Level Insights
         self._formula_value_leakage_index()
         self._formula_strategy_execution_coverage()
@@ -1161,6 +1493,15 @@ class PortfolioAIEngine:
         self._formula_idle_capacity_hotspots()
         self._formula_execution_velocity_by_team()
         
+        # Sort each persona once here; the stable sort keeps the per-project indexes in severity order too
+        self.executive_insights = self._sorted_by_severity(self.executive_insights)
+        self.vp_insights = self._sorted_by_severity(self.vp_insights)
+        self.manager_insights = self._sorted_by_severity(self.manager_insights)
+        
+        self._exec_by_pid = self._index_by_project(self.executive_insights)
+        self._vp_by_pid = self._index_by_project(self.vp_insights)
+        self._mgr_by_pid = self._index_by_project(self.manager_insights)
+        
         print(f"\n✅ Generated {len(self.executive_insights)} Executive insights")
         print(f"✅ Generated {len(self.vp_insights)} VP insights")
         print(f"✅ Generated {len(self.manager_insights)} Manager insights")
@@ -1181,10 +1522,7 @@ class PortfolioAIEngine:
         
         data_sources_available = set()
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
+        for proj_id, proj_data in self._valid_projects:
             actuals = proj_data.get('actuals_summary', {})
             wave = proj_data.get('latest_wave_snapshot', {})
             baseline = proj_data.get('baseline_metrics', {})
@@ -1202,8 +1540,8 @@ class PortfolioAIEngine:
                     data_sources_available.add('smartsheet')
                 
                 value_lever = wave.get('value_lever') if wave else None
-                status = wave.get('status', '').lower() if wave else ''
-                smartsheet_status = baseline.get('schedule_health', '').lower() if baseline else ''
+                status = self._status_lc[proj_id]
+                smartsheet_status = self._schedule_health_lc[proj_id]
                 
                 is_stalled = 'stalled' in status or 'red' in smartsheet_status or 'delayed' in status
                 has_no_value_lever = not value_lever or str(value_lever).strip() == '' or str(value_lever).lower() == 'none'
@@ -1212,7 +1550,7 @@ class PortfolioAIEngine:
                     leakage_effort += effort
                     leakage_projects.append({
                         'project_id': proj_id,
-                        'project_name': proj_data['project_metadata'].get('project_name'),
+                        'project_name': self._project_names[proj_id],
                         'effort': effort,
                         'reason': 'No value lever' if has_no_value_lever else 'Stalled status'
                     })
@@ -1223,26 +1561,25 @@ class PortfolioAIEngine:
             confidence = 'High' if len(data_sources_available) >= 2 else 'Medium'
             
             if leakage_pct > 20:
-                self.executive_insights.append({
-                    'category': 'value_leakage',
-                    'title': f'Value Leakage Index: {leakage_pct:.1f}% Portfolio Effort at Risk',
-                    'severity': 'critical',
-                    'description': f"{leakage_pct:.1f}% of portfolio effort/cost is on projects with no clear value lever or stalled status",
-                    'impact': f"${leakage_effort/1000:.0f}K effort potentially not delivering value",
-                    'recommendation': 'Review value mapping for all projects and address stalled initiatives',
-                    'metrics': {
+                insight = self._make_insight(
+                    category='value_leakage',
+                    title=f'Value Leakage Index: {leakage_pct:.1f}% Portfolio Effort at Risk',
+                    severity='critical',
+                    description=f"{leakage_pct:.1f}% of portfolio effort/cost is on projects with no clear value lever or stalled status",
+                    impact=f"${leakage_effort/1000:.0f}K effort potentially not delivering value",
+                    recommendation='Review value mapping for all projects and address stalled initiatives',
+                    metrics={
                         'leakage_pct': leakage_pct,
                         'leakage_effort': leakage_effort,
                         'total_effort': total_effort,
                         'leakage_project_count': len(leakage_projects),
                         'top_contributors': leakage_projects
                     },
-                    'formula_used': 'Value Leakage % = (Effort on no-value/stalled projects) / Total Effort',
-                    'data_sources_used': list(data_sources_available),
-                    'project_id': None,
-                    'confidence': confidence
-                })
-                self.vp_insights.append(self.executive_insights[-1].copy())
+                    formula_used='Value Leakage % = (Effort on no-value/stalled projects) / Total Effort',
+                    data_sources_used=list(data_sources_available),
+                    confidence=confidence
+                )
+                self._promote(insight, self.executive_insights, self.vp_insights)
     
     def _formula_strategy_execution_coverage(self):
         """
@@ -1256,10 +1593,7 @@ class PortfolioAIEngine:
         
         data_sources_available = set()
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
+        for proj_id, proj_data in self._valid_projects:
             wave = proj_data.get('latest_wave_snapshot', {})
             baseline = proj_data.get('baseline_metrics', {})
             actuals = proj_data.get('actuals_summary', {})
@@ -1281,7 +1615,7 @@ class PortfolioAIEngine:
                 else:
                     uncovered_initiatives.append({
                         'project_id': proj_id,
-                        'project_name': proj_data['project_metadata'].get('project_name'),
+                        'project_name': self._project_names[proj_id],
                         'missing': 'Smartsheet' if not has_smartsheet else 'Tick hours'
                     })
         
@@ -1291,43 +1625,41 @@ class PortfolioAIEngine:
             confidence = 'High' if len(data_sources_available) == 3 else 'Low'
             
             if coverage_pct < 60:
-                self.executive_insights.append({
-                    'category': 'strategic_alignment',
-                    'title': f'Strategy-Execution Coverage: Only {coverage_pct:.1f}% Fully Linked',
-                    'severity': 'critical',
-                    'description': f"Only {covered_initiatives} of {total_wave_initiatives} Wave initiatives have both Smartsheet baseline and Tick execution data",
-                    'impact': 'Strategic initiatives not fully traceable from plan to execution',
-                    'recommendation': 'Establish full traceability for all Wave initiatives through Smartsheet and Tick',
-                    'metrics': {
+                self.executive_insights.append(self._make_insight(
+                    category='strategic_alignment',
+                    title=f'Strategy-Execution Coverage: Only {coverage_pct:.1f}% Fully Linked',
+                    severity='critical',
+                    description=f"Only {covered_initiatives} of {total_wave_initiatives} Wave initiatives have both Smartsheet baseline and Tick execution data",
+                    impact='Strategic initiatives not fully traceable from plan to execution',
+                    recommendation='Establish full traceability for all Wave initiatives through Smartsheet and Tick',
+                    metrics={
                         'coverage_pct': coverage_pct,
                         'covered_count': covered_initiatives,
                         'total_count': total_wave_initiatives,
                         'uncovered_initiatives': uncovered_initiatives
                     },
-                    'formula_used': 'Coverage % = Initiatives with (Smartsheet AND Tick) / Total Wave initiatives',
-                    'data_sources_used': list(data_sources_available),
-                    'project_id': None,
-                    'confidence': confidence
-                })
+                    formula_used='Coverage % = Initiatives with (Smartsheet AND Tick) / Total Wave initiatives',
+                    data_sources_used=list(data_sources_available),
+                    confidence=confidence
+                ))
             elif coverage_pct < 80:
-                self.vp_insights.append({
-                    'category': 'strategic_alignment',
-                    'title': f'Strategy-Execution Coverage: {coverage_pct:.1f}% Linked',
-                    'severity': 'warning',
-                    'description': f"{covered_initiatives} of {total_wave_initiatives} Wave initiatives have full traceability",
-                    'impact': 'Some strategic initiatives lack complete tracking',
-                    'recommendation': 'Improve data linkage for remaining initiatives',
-                    'metrics': {
+                self.vp_insights.append(self._make_insight(
+                    category='strategic_alignment',
+                    title=f'Strategy-Execution Coverage: {coverage_pct:.1f}% Linked',
+                    severity='warning',
+                    description=f"{covered_initiatives} of {total_wave_initiatives} Wave initiatives have full traceability",
+                    impact='Some strategic initiatives lack complete tracking',
+                    recommendation='Improve data linkage for remaining initiatives',
+                    metrics={
                         'coverage_pct': coverage_pct,
                         'covered_count': covered_initiatives,
                         'total_count': total_wave_initiatives,
                         'uncovered_initiatives': uncovered_initiatives
                     },
-                    'formula_used': 'Coverage % = Initiatives with (Smartsheet AND Tick) / Total Wave initiatives',
-                    'data_sources_used': list(data_sources_available),
-                    'project_id': None,
-                    'confidence': confidence
-                })
+                    formula_used='Coverage % = Initiatives with (Smartsheet AND Tick) / Total Wave initiatives',
+                    data_sources_used=list(data_sources_available),
+                    confidence=confidence
+                ))
     
     def _formula_top_bottom_analysis(self):
         """
@@ -1335,64 +1667,45 @@ class PortfolioAIEngine:
         Intersection = flagged projects
         """
         
-        projects_with_data = []
+        hours, cost = self._col_effort_hours, self._col_total_cost
+        effort = np.where(_truthy(hours), hours, cost)
+        idx = np.flatnonzero(self._valid_mask & (effort > 0))
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
+        if len(idx) >= 10:
+            completion, baseline_completion = self._col_completion_pct[idx], self._col_baseline_completion_pct[idx]
+            progress = np.where(_truthy(completion), completion,
+                                np.where(_truthy(baseline_completion), baseline_completion, 0))
             
-            actuals = proj_data.get('actuals_summary', {})
-            baseline = proj_data.get('baseline_metrics', {})
-            wave = proj_data.get('latest_wave_snapshot', {})
-            derived = proj_data.get('derived_metrics', {})
-            
-            effort = actuals.get('total_hours') or actuals.get('total_cost')
-            progress = derived.get('completion_pct') or baseline.get('completion_pct')
-            value_lever = wave.get('value_lever') if wave else None
-            
-            if effort and effort > 0:
-                projects_with_data.append({
-                    'project_id': proj_id,
-                    'project_name': proj_data['project_metadata'].get('project_name'),
-                    'effort': effort,
-                    'progress': progress if progress else 0,
-                    'has_value_lever': bool(value_lever and str(value_lever).strip() and str(value_lever).lower() != 'none')
-                })
-        
-        if len(projects_with_data) >= 10:
-            sorted_by_effort = sorted(projects_with_data, key=lambda x: x['effort'], reverse=True)
-            sorted_by_progress = sorted(projects_with_data, key=lambda x: x['progress'])
-            
-            top_10_pct_count = max(1, len(projects_with_data) // 10)
+            top_10_pct_count = max(1, len(idx) // 10)
             
-            top_effort = sorted_by_effort[:top_10_pct_count]
-            bottom_progress = sorted_by_progress[:top_10_pct_count]
+            # Stable sorts (not argpartition) so ties - e.g. the many 0% projects - resolve in portfolio order
+            top_effort = np.argsort(-effort[idx], kind='stable')[:top_10_pct_count]
+            bottom_progress = np.argsort(progress, kind='stable')[:top_10_pct_count]
+            flagged = top_effort[np.isin(top_effort, bottom_progress)]
             
-            flagged_projects = []
-            for te in top_effort:
-                for bp in bottom_progress:
-                    if te['project_id'] == bp['project_id']:
-                        flagged_projects.append(te)
-                        break
+            positions = idx[flagged]
+            flagged_projects = self._project_records(
+                positions,
+                effort=effort[positions].tolist(),
+                progress=[p or 0 for p in progress[flagged].tolist()],
+                has_value_lever=self._col_has_value[positions].tolist())
             
             if flagged_projects:
-                self.executive_insights.append({
-                    'category': 'value_leakage',
-                    'title': f'Top 10% Effort / Bottom 10% Outcome: {len(flagged_projects)} Projects Flagged',
-                    'severity': 'critical',
-                    'description': f"{len(flagged_projects)} projects consuming highest effort but delivering lowest progress/value",
-                    'impact': 'Significant resource investment with minimal return',
-                    'recommendation': 'Immediate review for scope reduction, reprioritization, or termination',
-                    'metrics': {
+                insight = self._make_insight(
+                    category='value_leakage',
+                    title=f'Top 10% Effort / Bottom 10% Outcome: {len(flagged_projects)} Projects Flagged',
+                    severity='critical',
+                    description=f"{len(flagged_projects)} projects consuming highest effort but delivering lowest progress/value",
+                    impact='Significant resource investment with minimal return',
+                    recommendation='Immediate review for scope reduction, reprioritization, or termination',
+                    metrics={
                         'flagged_count': len(flagged_projects),
                         'flagged_projects': flagged_projects
                     },
-                    'formula_used': 'Top 10% effort INTERSECT Bottom 10% progress',
-                    'data_sources_used': ['tick', 'smartsheet', 'wave'],
-                    'project_id': None,
-                    'confidence': 'High'
-                })
-                self.vp_insights.append(self.executive_insights[-1].copy())
+                    formula_used='Top 10% effort INTERSECT Bottom 10% progress',
+                    data_sources_used=['tick', 'smartsheet', 'wave']
+                )
+                self._promote(insight, self.executive_insights, self.vp_insights)
     
     def _formula_delivery_confidence_forecast(self):
         """
@@ -1401,67 +1714,43 @@ class PortfolioAIEngine:
         Requirement: >=2 sources
         """
         
-        at_risk_projects = []
+        completion, work_days = self._col_completion_pct, self._col_work_span
+        burn_rate, remaining_budget = self._col_burn_rate, self._col_remaining_budget
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            actuals = proj_data.get('actuals_summary', {})
-            derived = proj_data.get('derived_metrics', {})
-            trends = proj_data.get('wave_trends', {})
-            
-            data_sources = 0
-            risk_signals = []
-            
-            completion = derived.get('completion_pct')
-            work_days = actuals.get('work_span_days')
-            
-            if completion and work_days and work_days > 30:
-                data_sources += 1
-                velocity = completion / work_days
-                if velocity < 0.5:
-                    risk_signals.append('Low velocity')
-            
-            burn_rate = derived.get('daily_burn_rate')
-            remaining_budget = derived.get('remaining_budget')
-            
-            if burn_rate and burn_rate > 0 and remaining_budget:
-                data_sources += 1
-                days_remaining = remaining_budget / burn_rate if burn_rate > 0 else 999
-                if days_remaining < 30:
-                    risk_signals.append('High burn rate')
-            
-            if trends and trends.get('recent_deterioration'):
-                data_sources += 1
-                risk_signals.append('Task slippage trend')
-            
-            if data_sources >= 2 and len(risk_signals) >= 2:
-                at_risk_projects.append({
-                    'project_id': proj_id,
-                    'project_name': proj_data['project_metadata'].get('project_name'),
-                    'risk_signals': risk_signals,
-                    'forecast': 'Likely to Miss'
-                })
+        has_velocity = _truthy(completion) & (work_days > 30)
+        velocity = np.divide(completion, work_days, out=np.full(len(completion), np.inf), where=has_velocity)
+        
+        has_burn = (burn_rate > 0) & _truthy(remaining_budget)
+        days_remaining = np.divide(remaining_budget, burn_rate, out=np.full(len(burn_rate), np.inf), where=has_burn)
+        
+        has_slippage = self._col_recent_deterioration
+        signals = np.stack([velocity < 0.5, has_burn & (days_remaining < 30), has_slippage])
+        
+        data_sources = has_velocity.astype(int) + has_burn + has_slippage
+        at_risk = self._valid_mask & (data_sources >= 2) & (signals.sum(axis=0) >= 2)
+        
+        signal_names = np.array(['Low velocity', 'High burn rate', 'Task slippage trend'])
+        at_risk_projects = self._project_records(
+            np.flatnonzero(at_risk),
+            risk_signals=[signal_names[flags].tolist() for flags in signals[:, at_risk].T],
+            forecast=['Likely to Miss'] * int(at_risk.sum()))
         
         if at_risk_projects:
-            self.executive_insights.append({
-                'category': 'predictive_risk',
-                'title': f'Delivery Confidence Forecast: {len(at_risk_projects)} Projects Likely to Miss',
-                'severity': 'critical',
-                'description': f"{len(at_risk_projects)} projects show multiple risk signals indicating delivery failure",
-                'impact': 'Portfolio delivery commitments at risk',
-                'recommendation': 'Implement recovery plans or adjust expectations immediately',
-                'metrics': {
+            insight = self._make_insight(
+                category='predictive_risk',
+                title=f'Delivery Confidence Forecast: {len(at_risk_projects)} Projects Likely to Miss',
+                severity='critical',
+                description=f"{len(at_risk_projects)} projects show multiple risk signals indicating delivery failure",
+                impact='Portfolio delivery commitments at risk',
+                recommendation='Implement recovery plans or adjust expectations immediately',
+                metrics={
                     'at_risk_count': len(at_risk_projects),
                     'at_risk_projects': at_risk_projects
                 },
-                'formula_used': 'Risk Score = Low velocity + High burn + Slippage (binary: Likely to Miss)',
-                'data_sources_used': ['tick', 'smartsheet', 'wave'],
-                'project_id': None,
-                'confidence': 'High'
-            })
-            self.vp_insights.append(self.executive_insights[-1].copy())
+                formula_used='Risk Score = Low velocity + High burn + Slippage (binary: Likely to Miss)',
+                data_sources_used=['tick', 'smartsheet', 'wave']
+            )
+            self._promote(insight, self.executive_insights, self.vp_insights)
     
     # ========================================
     # TIER-2: PORTFOLIO & P&L INSIGHTS
@@ -1472,219 +1761,163 @@ class PortfolioAIEngine:
         Formula: Cost per Value Lever = Tick effort cost / Wave value delivered
         """
         
-        value_lever_costs = defaultdict(lambda: {'cost': 0, 'projects': []})
-        
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            actuals = proj_data.get('actuals_summary', {})
-            wave = proj_data.get('latest_wave_snapshot', {})
-            
-            cost = actuals.get('total_cost')
-            value_lever = wave.get('value_lever') if wave else None
-            
-            if cost and cost > 0 and value_lever and str(value_lever).strip():
-                value_lever_costs[value_lever]['cost'] += cost
-                value_lever_costs[value_lever]['projects'].append({
-                    'project_id': proj_id,
-                    'project_name': proj_data['project_metadata'].get('project_name'),
-                    'cost': cost
-                })
-        
-        if value_lever_costs:
-            sorted_levers = sorted(value_lever_costs.items(), key=lambda x: x[1]['cost'], reverse=True)
-            
-            self.vp_insights.append({
-                'category': 'value_leakage',
-                'title': f'Cost per Strategic Outcome: {len(value_lever_costs)} Value Levers Analyzed',
-                'severity': 'info',
-                'description': f"Investment distribution across {len(value_lever_costs)} strategic value levers",
-                'impact': 'Enables value-based portfolio optimization',
-                'recommendation': 'Rebalance investment toward highest-value levers',
-                'metrics': {
-                    'value_lever_count': len(value_lever_costs),
-                    'top_investments': [{'lever': k, 'cost': v['cost'], 'project_count': len(v['projects'])} for k, v in sorted_levers]
+        cost, levers = self._col_total_cost, self._col_value_lever
+        has_lever = np.fromiter((bool(v and str(v).strip()) for v in levers), dtype=bool, count=len(levers))
+        idx = np.flatnonzero(self._valid_mask & (cost > 0) & has_lever)
+        
+        if len(idx):
+            # bincount sums in portfolio order, like the running totals it replaces
+            codes, lever_names = pd.factorize(levers[idx])
+            lever_costs = np.bincount(codes, weights=cost[idx])
+            lever_counts = np.bincount(codes)
+            order = np.argsort(-lever_costs, kind='stable')
+            
+            self.vp_insights.append(self._make_insight(
+                category='value_leakage',
+                title=f'Cost per Strategic Outcome: {len(lever_names)} Value Levers Analyzed',
+                severity='info',
+                description=f"Investment distribution across {len(lever_names)} strategic value levers",
+                impact='Enables value-based portfolio optimization',
+                recommendation='Rebalance investment toward highest-value levers',
+                metrics={
+                    'value_lever_count': len(lever_names),
+                    'top_investments': [{'lever': lever_names[i], 'cost': lever_costs[i].item(), 'project_count': lever_counts[i].item()} for i in order]
                 },
-                'formula_used': 'Cost per Value Lever = Total Tick cost / Value Lever',
-                'data_sources_used': ['tick', 'wave'],
-                'project_id': None,
-                'confidence': 'High'
-            })
+                formula_used='Cost per Value Lever = Total Tick cost / Value Lever',
+                data_sources_used=['tick', 'wave']
+            ))
     
     def _formula_execution_drag_index(self):
         """
         Formula: Drag Days = (First Smartsheet task start) - (Wave approval date)
         """
         
-        drag_projects = []
+        task_start, approval_date = self._col_baseline_start, self._col_approval_date
+        idx = np.flatnonzero(self._valid_mask & (task_start > approval_date))
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            baseline = proj_data.get('baseline_metrics', {})
-            wave = proj_data.get('latest_wave_snapshot', {})
-            
-            task_start = self._safe_date(baseline.get('baseline_start'))
-            approval_date = self._safe_date(wave.get('approval_date'))
-            
-            if task_start and approval_date and task_start > approval_date:
-                drag_days = (task_start - approval_date).days
-                
-                if drag_days > 30:
-                    drag_projects.append({
-                        'project_id': proj_id,
-                        'project_name': proj_data['project_metadata'].get('project_name'),
-                        'drag_days': drag_days,
-                        'approval_date': str(approval_date.date()),
-                        'start_date': str(task_start.date())
-                    })
+        # Floor to whole days, as timedelta.days does
+        drag_days = (task_start[idx] - approval_date[idx]) // np.timedelta64(1, 'D')
+        keep = drag_days > 30
+        idx, drag_days = idx[keep], drag_days[keep]
+        
+        drag_projects = self._project_records(
+            idx,
+            drag_days=drag_days.tolist(),
+            approval_date=np.datetime_as_string(approval_date[idx], unit='D').tolist(),
+            start_date=np.datetime_as_string(task_start[idx], unit='D').tolist())
         
         if drag_projects:
-            avg_drag = sum(p['drag_days'] for p in drag_projects) / len(drag_projects)
-            
-            self.vp_insights.append({
-                'category': 'velocity',
-                'title': f'Execution Drag Index: {avg_drag:.0f} Days Average Delay',
-                'severity': 'warning',
-                'description': f"{len(drag_projects)} projects show significant delay between approval and execution start",
-                'impact': f"Average {avg_drag:.0f} days lost between approval and start",
-                'recommendation': 'Streamline project kickoff and resource allocation processes',
-                'metrics': {
+            avg_drag = drag_days.sum().item() / len(drag_projects)
+            # Full ranking is kept (the UI lists every offender); stable, so ties stay in portfolio order
+            worst_offenders = [drag_projects[i] for i in np.argsort(-drag_days, kind='stable')]
+            
+            insight = self._make_insight(
+                category='velocity',
+                title=f'Execution Drag Index: {avg_drag:.0f} Days Average Delay',
+                severity='warning',
+                description=f"{len(drag_projects)} projects show significant delay between approval and execution start",
+                impact=f"Average {avg_drag:.0f} days lost between approval and start",
+                recommendation='Streamline project kickoff and resource allocation processes',
+                metrics={
                     'avg_drag_days': avg_drag,
                     'affected_projects': len(drag_projects),
-                    'worst_offenders': sorted(drag_projects, key=lambda x: x['drag_days'], reverse=True)
+                    'worst_offenders': worst_offenders
                 },
-                'formula_used': 'Drag Days = Task Start Date - Approval Date',
-                'data_sources_used': ['smartsheet', 'wave'],
-                'project_id': None,
-                'confidence': 'High'
-            })
-            self.manager_insights.append(self.vp_insights[-1].copy())
+                formula_used='Drag Days = Task Start Date - Approval Date',
+                data_sources_used=['smartsheet', 'wave']
+            )
+            self._promote(insight, self.vp_insights, self.manager_insights)
     
     def _formula_investment_map(self):
         """
         Logic: Over-invested (high effort + low value), Under-invested (low effort + high value)
         """
         
-        over_invested = []
-        under_invested = []
-        
-        projects_with_data = []
+        hours, cost = self._col_effort_hours, self._col_total_cost
+        effort = np.where(_truthy(hours), hours, cost)
+        idx = np.flatnonzero(self._valid_mask & (effort > 0))
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            actuals = proj_data.get('actuals_summary', {})
-            wave = proj_data.get('latest_wave_snapshot', {})
-            derived = proj_data.get('derived_metrics', {})
-            
-            effort = actuals.get('total_hours') or actuals.get('total_cost')
-            value_lever = wave.get('value_lever') if wave else None
-            progress = derived.get('completion_pct')
+        if len(idx) >= 4:
+            effort = effort[idx]
+            has_value = self._col_has_value[idx]
+            completion = self._col_completion_pct[idx]
+            # Missing progress is reported as int 0, as before
+            progress = np.array([p or 0 for p in np.where(_truthy(completion), completion, 0).tolist()], dtype=object)
             
-            if effort and effort > 0:
-                has_value = bool(value_lever and str(value_lever).strip() and str(value_lever).lower() != 'none')
-                
-                projects_with_data.append({
-                    'project_id': proj_id,
-                    'project_name': proj_data['project_metadata'].get('project_name'),
-                    'effort': effort,
-                    'has_value': has_value,
-                    'progress': progress if progress else 0
-                })
-        
-        if len(projects_with_data) >= 4:
-            median_effort = sorted([p['effort'] for p in projects_with_data])[len(projects_with_data)//2]
+            # Upper median, as before: O(n) selection instead of a full sort
+            median_effort = np.partition(effort, len(idx) // 2)[len(idx) // 2]
             
-            for proj in projects_with_data:
-                if proj['effort'] > median_effort and not proj['has_value']:
-                    over_invested.append(proj)
-                elif proj['effort'] < median_effort and proj['has_value']:
-                    under_invested.append(proj)
+            over = (effort > median_effort) & ~has_value
+            under = (effort < median_effort) & has_value
+            over_invested = self._project_records(idx[over], effort=effort[over].tolist(),
+                                                  has_value=has_value[over].tolist(), progress=progress[over])
+            under_invested = self._project_records(idx[under], effort=effort[under].tolist(),
+                                                   has_value=has_value[under].tolist(), progress=progress[under])
             
             if over_invested:
-                self.vp_insights.append({
-                    'category': 'prioritization',
-                    'title': f'Over-Investment Alert: {len(over_invested)} Projects',
-                    'severity': 'warning',
-                    'description': f"{len(over_invested)} projects consuming above-median effort with no clear value lever",
-                    'impact': 'Inefficient resource allocation',
-                    'recommendation': 'Review value proposition or reduce investment',
-                    'metrics': {
+                self.vp_insights.append(self._make_insight(
+                    category='prioritization',
+                    title=f'Over-Investment Alert: {len(over_invested)} Projects',
+                    severity='warning',
+                    description=f"{len(over_invested)} projects consuming above-median effort with no clear value lever",
+                    impact='Inefficient resource allocation',
+                    recommendation='Review value proposition or reduce investment',
+                    metrics={
                         'over_invested_count': len(over_invested),
                         'projects': over_invested
                     },
-                    'formula_used': 'Over-invested = High effort + No value lever',
-                    'data_sources_used': ['tick', 'wave'],
-                    'project_id': None,
-                    'confidence': 'High'
-                })
+                    formula_used='Over-invested = High effort + No value lever',
+                    data_sources_used=['tick', 'wave']
+                ))
             
             if under_invested:
-                self.vp_insights.append({
-                    'category': 'prioritization',
-                    'title': f'Under-Investment Opportunity: {len(under_invested)} Projects',
-                    'severity': 'info',
-                    'description': f"{len(under_invested)} high-value projects receiving below-median investment",
-                    'impact': 'Potential for accelerated value delivery',
-                    'recommendation': '⚡ ACCELERATE: Consider increasing investment',
-                    'metrics': {
+                self.vp_insights.append(self._make_insight(
+                    category='prioritization',
+                    title=f'Under-Investment Opportunity: {len(under_invested)} Projects',
+                    severity='info',
+                    description=f"{len(under_invested)} high-value projects receiving below-median investment",
+                    impact='Potential for accelerated value delivery',
+                    recommendation='⚡ ACCELERATE: Consider increasing investment',
+                    metrics={
                         'under_invested_count': len(under_invested),
                         'projects': under_invested
                     },
-                    'formula_used': 'Under-invested = Low effort + Has value lever',
-                    'data_sources_used': ['tick', 'wave'],
-                    'project_id': None,
-                    'confidence': 'High'
-                })
+                    formula_used='Under-invested = Low effort + Has value lever',
+                    data_sources_used=['tick', 'wave']
+                ))
     
     def _formula_hidden_dependency_risk(self):
         """
         Rule: Smartsheet status = Green AND (Tick effort = 0 OR upstream dependency stalled)
         """
         
-        at_risk_projects = []
+        has_effort = _truthy(self._col_effort_hours)
+        has_dependencies = self._col_has_dependencies
+        is_green = pd.Series(self._col_schedule_health_lc, dtype=object).str.contains('green', regex=False).to_numpy(dtype=bool)
+        at_risk = self._valid_mask & is_green & (~has_effort | has_dependencies)
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            baseline = proj_data.get('baseline_metrics', {})
-            actuals = proj_data.get('actuals_summary', {})
-            
-            status = baseline.get('schedule_health', '').lower()
-            has_effort = bool(actuals and actuals.get('total_hours'))
-            has_dependencies = baseline.get('interdependencies')
-            
-            if 'green' in status and (not has_effort or has_dependencies):
-                at_risk_projects.append({
-                    'project_id': proj_id,
-                    'project_name': proj_data['project_metadata'].get('project_name'),
-                    'reason': 'No execution despite green status' if not has_effort else 'Has dependencies',
-                    'dependencies': has_dependencies if has_dependencies else 'None listed'
-                })
+        dependencies = self._col_interdependencies[at_risk]
+        at_risk_projects = self._project_records(
+            np.flatnonzero(at_risk),
+            reason=np.where(has_effort[at_risk], 'Has dependencies', 'No execution despite green status').tolist(),
+            dependencies=np.where(has_dependencies[at_risk], dependencies, 'None listed').tolist())
         
         if at_risk_projects:
-            self.vp_insights.append({
-                'category': 'execution_health',
-                'title': f'Hidden Dependency Risk: {len(at_risk_projects)} Projects',
-                'severity': 'warning',
-                'description': f"{len(at_risk_projects)} projects report green status but show no execution or have dependencies",
-                'impact': 'False confidence in project health',
-                'recommendation': 'Validate dependency status and execution progress',
-                'metrics': {
+            insight = self._make_insight(
+                category='execution_health',
+                title=f'Hidden Dependency Risk: {len(at_risk_projects)} Projects',
+                severity='warning',
+                description=f"{len(at_risk_projects)} projects report green status but show no execution or have dependencies",
+                impact='False confidence in project health',
+                recommendation='Validate dependency status and execution progress',
+                metrics={
                     'at_risk_count': len(at_risk_projects),
                     'projects': at_risk_projects
                 },
-                'formula_used': 'Green status AND (No Tick effort OR Has dependencies)',
-                'data_sources_used': ['smartsheet', 'tick'],
-                'project_id': None,
-                'confidence': 'High'
-            })
-            self.manager_insights.append(self.vp_insights[-1].copy())
+                formula_used='Green status AND (No Tick effort OR Has dependencies)',
+                data_sources_used=['smartsheet', 'tick']
+            )
+            self._promote(insight, self.vp_insights, self.manager_insights)
     
     # ========================================
     # TIER-3: OPERATIONAL EXCELLENCE INSIGHTS
@@ -1695,208 +1928,145 @@ class PortfolioAIEngine:
         Rule: Increasing Tick hours + Flat Smartsheet % complete
         """
         
-        mismatch_projects = []
+        actual_hours, planned_hours = self._col_effort_hours, self._col_planned_hours
+        completion = self._col_completion_pct
+        mismatch = (self._valid_mask & _truthy(actual_hours) & _truthy(planned_hours) & _truthy(completion)
+                    & (actual_hours > planned_hours * 0.5) & (completion < 40))
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            actuals = proj_data.get('actuals_summary', {})
-            derived = proj_data.get('derived_metrics', {})
-            baseline = proj_data.get('baseline_metrics', {})
-            
-            actual_hours = actuals.get('total_hours')
-            planned_hours = baseline.get('planned_hours')
-            completion = derived.get('completion_pct')
-            
-            if actual_hours and planned_hours and completion:
-                implied_completion = (actual_hours / planned_hours) * 100
-                
-                if actual_hours > planned_hours * 0.5 and completion < 40:
-                    mismatch_projects.append({
-                        'project_id': proj_id,
-                        'project_name': proj_data['project_metadata'].get('project_name'),
-                        'actual_hours': actual_hours,
-                        'planned_hours': planned_hours,
-                        'reported_completion': completion,
-                        'implied_completion': implied_completion,
-                        'gap': implied_completion - completion
-                    })
+        implied_completion = (actual_hours[mismatch] / planned_hours[mismatch]) * 100
+        mismatch_projects = self._project_records(
+            np.flatnonzero(mismatch),
+            actual_hours=actual_hours[mismatch].tolist(),
+            planned_hours=planned_hours[mismatch].tolist(),
+            reported_completion=completion[mismatch].tolist(),
+            implied_completion=implied_completion.tolist(),
+            gap=(implied_completion - completion[mismatch]).tolist())
         
         if mismatch_projects:
-            self.manager_insights.append({
-                'category': 'data_hygiene',
-                'title': f'Effort-Progress Mismatch: {len(mismatch_projects)} Projects',
-                'severity': 'warning',
-                'description': f"{len(mismatch_projects)} projects show high effort but low reported progress",
-                'impact': 'Potential productivity issues or data quality problems',
-                'recommendation': 'Reconcile completion % with actual work performed',
-                'metrics': {
+            self.manager_insights.append(self._make_insight(
+                category='data_hygiene',
+                title=f'Effort-Progress Mismatch: {len(mismatch_projects)} Projects',
+                severity='warning',
+                description=f"{len(mismatch_projects)} projects show high effort but low reported progress",
+                impact='Potential productivity issues or data quality problems',
+                recommendation='Reconcile completion % with actual work performed',
+                metrics={
                     'mismatch_count': len(mismatch_projects),
                     'projects': mismatch_projects
                 },
-                'formula_used': 'Actual hours > 50% planned AND Completion < 40%',
-                'data_sources_used': ['tick', 'smartsheet'],
-                'project_id': None,
-                'confidence': 'High'
-            })
+                formula_used='Actual hours > 50% planned AND Completion < 40%',
+                data_sources_used=['tick', 'smartsheet']
+            ))
     
     def _formula_resource_utilization_quality(self):
         """
         Formula: Strategic Utilization = Effort on Wave-linked work / Total effort
         """
         
-        total_effort = 0
-        strategic_effort = 0
+        hours = self._col_effort_hours
+        logged = self._valid_mask & (hours > 0)
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            actuals = proj_data.get('actuals_summary', {})
-            wave = proj_data.get('latest_wave_snapshot', {})
-            
-            effort = actuals.get('total_hours')
-            
-            if effort and effort > 0:
-                total_effort += effort
-                
-                if wave:
-                    strategic_effort += effort
+        total_effort = float(hours[logged].sum())
+        strategic_effort = float(hours[logged & self._col_has_wave].sum())
         
         if total_effort > 0:
             strategic_util_pct = (strategic_effort / total_effort) * 100
             
             if strategic_util_pct < 70:
-                self.vp_insights.append({
-                    'category': 'resource_utilization',
-                    'title': f'Resource Utilization Quality: {strategic_util_pct:.1f}% Strategic',
-                    'severity': 'warning',
-                    'description': f"Only {strategic_util_pct:.1f}% of total effort is linked to Wave strategic initiatives",
-                    'impact': 'Significant effort on non-strategic work',
-                    'recommendation': 'Review unlinked effort and validate strategic alignment',
-                    'metrics': {
+                self.vp_insights.append(self._make_insight(
+                    category='resource_utilization',
+                    title=f'Resource Utilization Quality: {strategic_util_pct:.1f}% Strategic',
+                    severity='warning',
+                    description=f"Only {strategic_util_pct:.1f}% of total effort is linked to Wave strategic initiatives",
+                    impact='Significant effort on non-strategic work',
+                    recommendation='Review unlinked effort and validate strategic alignment',
+                    metrics={
                         'strategic_util_pct': strategic_util_pct,
                         'strategic_effort': strategic_effort,
                         'total_effort': total_effort,
                         'non_strategic_effort': total_effort - strategic_effort
                     },
-                    'formula_used': 'Strategic Utilization = Wave-linked effort / Total effort',
-                    'data_sources_used': ['tick', 'wave'],
-                    'project_id': None,
-                    'confidence': 'High'
-                })
+                    formula_used='Strategic Utilization = Wave-linked effort / Total effort',
+                    data_sources_used=['tick', 'wave']
+                ))
     
     def _formula_managerial_span_effectiveness(self):
         """
         Rule: High # initiatives per manager + Correlated with slippage/inefficiency
         """
         
-        manager_loads = defaultdict(lambda: {'projects': [], 'total_delay': 0, 'over_budget_count': 0})
+        owners = self._col_owner
+        has_owner = np.fromiter((bool(o and str(o).strip()) for o in owners), dtype=bool, count=len(owners))
+        idx = np.flatnonzero(self._valid_mask & has_owner)
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            baseline = proj_data.get('baseline_metrics', {})
-            derived = proj_data.get('derived_metrics', {})
-            
-            owner = baseline.get('owner')
-            schedule_variance = derived.get('schedule_variance_days', 0)
-            budget_overrun = derived.get('budget_overrun', False)
-            
-            if owner and str(owner).strip():
-                manager_loads[owner]['projects'].append(proj_id)
-                if schedule_variance > 0:
-                    manager_loads[owner]['total_delay'] += schedule_variance
-                if budget_overrun:
-                    manager_loads[owner]['over_budget_count'] += 1
+        codes, managers = pd.factorize(owners[idx])
+        schedule_variance = self._col_schedule_variance[idx]
+        project_counts = np.bincount(codes, minlength=len(managers))
+        total_delay = np.bincount(codes, weights=np.where(schedule_variance > 0, schedule_variance, 0), minlength=len(managers))
+        over_budget_counts = np.bincount(codes[self._col_budget_overrun[idx]], minlength=len(managers))
         
-        overloaded_managers = []
+        avg_delay = total_delay / project_counts
+        overloaded = (project_counts >= 5) & ((avg_delay > 30) | (over_budget_counts > project_counts * 0.5))
         
-        for manager, data in manager_loads.items():
-            project_count = len(data['projects'])
-            
-            if project_count >= 5:
-                avg_delay = data['total_delay'] / project_count if project_count > 0 else 0
-                
-                if avg_delay > 30 or data['over_budget_count'] > project_count * 0.5:
-                    overloaded_managers.append({
-                        'manager': manager,
-                        'project_count': project_count,
-                        'avg_delay_days': avg_delay,
-                        'over_budget_count': data['over_budget_count']
-                    })
+        overloaded_managers = [{
+            'manager': managers[i],
+            'project_count': project_counts[i].item(),
+            'avg_delay_days': avg_delay[i].item(),
+            'over_budget_count': over_budget_counts[i].item()
+        } for i in np.flatnonzero(overloaded)]
         
         if overloaded_managers:
-            self.vp_insights.append({
-                'category': 'resource_utilization',
-                'title': f'Managerial Span Effectiveness: {len(overloaded_managers)} Overloaded Managers',
-                'severity': 'warning',
-                'description': f"{len(overloaded_managers)} managers with high project counts show correlation with delays and overruns",
-                'impact': 'Managerial overload driving poor project outcomes',
-                'recommendation': 'Rebalance project assignments and consider additional management support',
-                'metrics': {
+            self.vp_insights.append(self._make_insight(
+                category='resource_utilization',
+                title=f'Managerial Span Effectiveness: {len(overloaded_managers)} Overloaded Managers',
+                severity='warning',
+                description=f"{len(overloaded_managers)} managers with high project counts show correlation with delays and overruns",
+                impact='Managerial overload driving poor project outcomes',
+                recommendation='Rebalance project assignments and consider additional management support',
+                metrics={
                     'overloaded_count': len(overloaded_managers),
                     'managers': overloaded_managers
                 },
-                'formula_used': 'High project count + Correlated delays/overruns',
-                'data_sources_used': ['smartsheet'],
-                'project_id': None,
-                'confidence': 'High'
-            })
+                formula_used='High project count + Correlated delays/overruns',
+                data_sources_used=['smartsheet']
+            ))
     
     def _formula_burnout_risk_radar(self):
         """
         Rule: Sustained high effort + Low delivery movement
         """
         
-        burnout_risk_projects = []
+        hours, work_span = self._col_effort_hours, self._col_work_span
+        unique_resources, completion = self._col_unique_resources, self._col_completion_pct
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            actuals = proj_data.get('actuals_summary', {})
-            derived = proj_data.get('derived_metrics', {})
-            
-            total_hours = actuals.get('total_hours')
-            work_span = actuals.get('work_span_days')
-            completion = derived.get('completion_pct')
-            unique_resources = actuals.get('unique_resources')
-            
-            if total_hours and work_span and work_span > 60 and unique_resources:
-                avg_hours_per_resource = total_hours / unique_resources
-                
-                if avg_hours_per_resource > 200 and completion and completion < 50:
-                    burnout_risk_projects.append({
-                        'project_id': proj_id,
-                        'project_name': proj_data['project_metadata'].get('project_name'),
-                        'total_hours': total_hours,
-                        'unique_resources': unique_resources,
-                        'avg_hours_per_resource': avg_hours_per_resource,
-                        'completion': completion,
-                        'work_span_days': work_span
-                    })
+        sustained = self._valid_mask & _truthy(hours) & (work_span > 60) & _truthy(unique_resources)
+        avg_hours_per_resource = np.divide(hours, unique_resources, out=np.zeros(len(hours)), where=sustained)
+        at_risk = sustained & (avg_hours_per_resource > 200) & _truthy(completion) & (completion < 50)
+        
+        burnout_risk_projects = self._project_records(
+            np.flatnonzero(at_risk),
+            total_hours=hours[at_risk].tolist(),
+            unique_resources=unique_resources[at_risk].astype(int).tolist(),
+            avg_hours_per_resource=avg_hours_per_resource[at_risk].tolist(),
+            completion=completion[at_risk].tolist(),
+            work_span_days=work_span[at_risk].astype(int).tolist())
         
         if burnout_risk_projects:
-            self.vp_insights.append({
-                'category': 'resource_utilization',
-                'title': f'Burnout Risk Radar: {len(burnout_risk_projects)} Projects at Risk',
-                'severity': 'critical',
-                'description': f"{len(burnout_risk_projects)} projects show sustained high effort with low progress",
-                'impact': 'Team burnout and attrition risk',
-                'recommendation': 'Review team health, scope, and consider resource rotation',
-                'metrics': {
+            insight = self._make_insight(
+                category='resource_utilization',
+                title=f'Burnout Risk Radar: {len(burnout_risk_projects)} Projects at Risk',
+                severity='critical',
+                description=f"{len(burnout_risk_projects)} projects show sustained high effort with low progress",
+                impact='Team burnout and attrition risk',
+                recommendation='Review team health, scope, and consider resource rotation',
+                metrics={
                     'at_risk_count': len(burnout_risk_projects),
                     'projects': burnout_risk_projects
                 },
-                'formula_used': 'Sustained effort (>200 hrs/person) + Low progress (<50%)',
-                'data_sources_used': ['tick', 'smartsheet'],
-                'project_id': None,
-                'confidence': 'High'
-            })
-            self.manager_insights.append(self.vp_insights[-1].copy())
+                formula_used='Sustained effort (>200 hrs/person) + Low progress (<50%)',
+                data_sources_used=['tick', 'smartsheet']
+            )
+            self._promote(insight, self.vp_insights, self.manager_insights)
     
     # ========================================
     # TIER-4: EXECUTION HYGIENE INSIGHTS
@@ -1910,47 +2080,28 @@ class PortfolioAIEngine:
         if self.tick_data is None:
             return
         
-        phantom_hours = 0
-        phantom_projects = []
+        hours = self._col_effort_hours
+        phantom = self._valid_mask & _truthy(hours) & ~self._col_has_smartsheet & ~self._col_has_wave
         
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            actuals = proj_data.get('actuals_summary', {})
-            baseline = proj_data.get('baseline_metrics', {})
-            wave = proj_data.get('latest_wave_snapshot', {})
-            
-            has_tick = bool(actuals and actuals.get('total_hours'))
-            has_smartsheet = bool(baseline)
-            has_wave = bool(wave)
-            
-            if has_tick and not has_smartsheet and not has_wave:
-                phantom_hours += actuals.get('total_hours', 0)
-                phantom_projects.append({
-                    'project_id': proj_id,
-                    'project_name': proj_data['project_metadata'].get('project_name'),
-                    'hours': actuals.get('total_hours', 0)
-                })
+        phantom_hours = float(hours[phantom].sum())
+        phantom_projects = self._project_records(np.flatnonzero(phantom), hours=hours[phantom].tolist())
         
         if phantom_hours > 0:
-            self.manager_insights.append({
-                'category': 'data_hygiene',
-                'title': f'Phantom Work Detection: {phantom_hours:.0f} Hours Unaccounted',
-                'severity': 'warning',
-                'description': f"{phantom_hours:.0f} hours logged in Tick with no Smartsheet task or Wave mapping",
-                'impact': 'Work being performed outside of approved project scope',
-                'recommendation': 'Investigate unlinked work and ensure proper project setup',
-                'metrics': {
+            self.manager_insights.append(self._make_insight(
+                category='data_hygiene',
+                title=f'Phantom Work Detection: {phantom_hours:.0f} Hours Unaccounted',
+                severity='warning',
+                description=f"{phantom_hours:.0f} hours logged in Tick with no Smartsheet task or Wave mapping",
+                impact='Work being performed outside of approved project scope',
+                recommendation='Investigate unlinked work and ensure proper project setup',
+                metrics={
                     'phantom_hours': phantom_hours,
                     'phantom_project_count': len(phantom_projects),
                     'projects': phantom_projects
                 },
-                'formula_used': 'Tick hours AND (No Smartsheet task AND No Wave mapping)',
-                'data_sources_used': ['tick'],
-                'project_id': None,
-                'confidence': 'High'
-            })
+                formula_used='Tick hours AND (No Smartsheet task AND No Wave mapping)',
+                data_sources_used=['tick']
+            ))
     
     def _formula_task_hygiene_score(self):
         """
@@ -1960,52 +2111,45 @@ class PortfolioAIEngine:
         if self.smartsheet_data is None:
             return
         
-        total_tasks = len(self.smartsheet_data)
-        complete_tasks = 0
+        df = self.smartsheet_data
+        owner_col = self.smartsheet_cols.get('owner')
+        start_col = self.smartsheet_cols.get('start_date')
+        finish_col = self.smartsheet_cols.get('finish_date')
+        hours_col = self.smartsheet_cols.get('hours')
         
-        for idx, row in self.smartsheet_data.iterrows():
-            has_owner = False
-            has_dates = False
-            has_effort = False
-            
-            if self.smartsheet_cols.get('owner'):
-                owner_val = row.get(self.smartsheet_cols['owner'])
-                has_owner = bool(owner_val and str(owner_val).strip())
-            
-            if self.smartsheet_cols.get('start_date') and self.smartsheet_cols.get('finish_date'):
-                start_val = self._safe_date(row.get(self.smartsheet_cols['start_date']))
-                end_val = self._safe_date(row.get(self.smartsheet_cols['finish_date']))
-                has_dates = bool(start_val and end_val)
-            
-            if self.smartsheet_cols.get('hours'):
-                effort_val = self._safe_numeric(row.get(self.smartsheet_cols['hours']))
-                has_effort = bool(effort_val and effort_val > 0)
-            
-            if has_owner and has_dates and has_effort:
-                complete_tasks += 1
+        if not (owner_col and start_col and finish_col and hours_col):
+            # A task is complete only with owner, dates and effort, so a missing column means none are
+            has_all = pd.Series(False, index=df.index)
+        else:
+            owners = df[owner_col]
+            has_owner = owners.notna() & (owners.astype(str).str.strip() != '')
+            has_dates = self._parse_date_series(df[start_col]).notna() & self._parse_date_series(df[finish_col]).notna()
+            has_effort = self._parse_numeric_series(df[hours_col]) > 0
+            has_all = has_owner & has_dates & has_effort
+        
+        total_tasks = len(df)
+        complete_tasks = int(has_all.sum())
         
         if total_tasks > 0:
             hygiene_pct = (complete_tasks / total_tasks) * 100
             
             if hygiene_pct < 70:
-                self.manager_insights.append({
-                    'category': 'data_hygiene',
-                    'title': f'Task Hygiene Score: {hygiene_pct:.1f}% Complete',
-                    'severity': 'warning',
-                    'description': f"Only {hygiene_pct:.1f}% of Smartsheet tasks have owner, dates, and effort defined",
-                    'impact': 'Incomplete task definition impairs planning and tracking',
-                    'recommendation': 'Enforce task completeness standards in Smartsheet',
-                    'metrics': {
+                self.manager_insights.append(self._make_insight(
+                    category='data_hygiene',
+                    title=f'Task Hygiene Score: {hygiene_pct:.1f}% Complete',
+                    severity='warning',
+                    description=f"Only {hygiene_pct:.1f}% of Smartsheet tasks have owner, dates, and effort defined",
+                    impact='Incomplete task definition impairs planning and tracking',
+                    recommendation='Enforce task completeness standards in Smartsheet',
+                    metrics={
                         'hygiene_pct': hygiene_pct,
                         'complete_tasks': complete_tasks,
                         'total_tasks': total_tasks,
                         'incomplete_tasks': total_tasks - complete_tasks
                     },
-                    'formula_used': 'Hygiene % = Tasks with (owner + dates + effort) / Total tasks',
-                    'data_sources_used': ['smartsheet'],
-                    'project_id': None,
-                    'confidence': 'High'
-                })
+                    formula_used='Hygiene % = Tasks with (owner + dates + effort) / Total tasks',
+                    data_sources_used=['smartsheet']
+                ))
     
     def _formula_idle_capacity_hotspots(self):
         """
@@ -2019,144 +2163,142 @@ class PortfolioAIEngine:
         if not resource_col:
             return
         
-        resource_hours = defaultdict(lambda: {'total_hours': 0, 'projects': set()})
+        hours_col = self.tick_cols.get('actual_hours') or self.tick_cols.get('hours')
+        if not hours_col:
+            return
         
-        for idx, row in self.tick_data.iterrows():
-            resource = row.get(resource_col)
-            hours = self._safe_numeric(row.get(self.tick_cols.get('actual_hours') or self.tick_cols.get('hours')))
-            
-            proj_id_col = self.tick_cols.get('wave_num') or self.tick_cols.get('id')
-            proj_id = row.get(proj_id_col) if proj_id_col else None
-            
-            if resource and hours:
-                resource_hours[resource]['total_hours'] += hours
-                if proj_id:
-                    resource_hours[resource]['projects'].add(self._normalize_project_id(proj_id))
-        
-        low_utilization_resources = []
-        
-        for resource, data in resource_hours.items():
-            if data['total_hours'] < 100:
-                low_utilization_resources.append({
-                    'resource': resource,
-                    'total_hours': data['total_hours'],
-                    'project_count': len(data['projects'])
-                })
+        df = self.tick_data
+        resources = df[resource_col]
+        hours = self._parse_numeric_series(df[hours_col])
+        logged = resources.notna() & resources.astype(object).astype(bool) & hours.notna() & (hours != 0)
+        
+        # Project keys were normalized into _norm_id at load
+        proj_ids = df[self.tick_cols.get('wave_num') or self.tick_cols['id']]
+        projects = df['_norm_id'].where(proj_ids.notna() & proj_ids.astype(bool))
+        
+        per_resource = pd.DataFrame({
+            'resource': resources[logged], 'total_hours': hours[logged], 'project': projects[logged]
+        }).groupby('resource', sort=False, observed=True).agg(total_hours=('total_hours', 'sum'), project_count=('project', 'nunique'))
+        
+        low_utilization_resources = per_resource[per_resource['total_hours'] < 100].reset_index().to_dict('records')
         
         if len(low_utilization_resources) > 5:
             total_idle_hours = sum(r['total_hours'] for r in low_utilization_resources)
             
-            self.manager_insights.append({
-                'category': 'resource_utilization',
-                'title': f'Idle Capacity Hotspots: {len(low_utilization_resources)} Under-Utilized Resources',
-                'severity': 'info',
-                'description': f"{len(low_utilization_resources)} resources show low utilization with ~{total_idle_hours:.0f} total hours",
-                'impact': 'Potential capacity for strategic initiatives',
-                'recommendation': 'Review availability and consider strategic assignments',
-                'metrics': {
+            self.manager_insights.append(self._make_insight(
+                category='resource_utilization',
+                title=f'Idle Capacity Hotspots: {len(low_utilization_resources)} Under-Utilized Resources',
+                severity='info',
+                description=f"{len(low_utilization_resources)} resources show low utilization with ~{total_idle_hours:.0f} total hours",
+                impact='Potential capacity for strategic initiatives',
+                recommendation='Review availability and consider strategic assignments',
+                metrics={
                     'low_util_count': len(low_utilization_resources),
                     'total_idle_hours': total_idle_hours,
                     'resources': low_utilization_resources
                 },
-                'formula_used': 'Resources with <100 hours logged',
-                'data_sources_used': ['tick'],
-                'project_id': None,
-                'confidence': 'Medium'
-            })
+                formula_used='Resources with <100 hours logged',
+                data_sources_used=['tick'],
+                confidence='Medium'
+            ))
     # hellooooo
     def _formula_execution_velocity_by_team(self):
         """
         Formula: Velocity = Tasks completed / Effort hours
         """
         
-        team_velocities = defaultdict(lambda: {'completed': 0, 'hours': 0, 'projects': []})
-        
-        for proj_id, proj_data in self.projects.items():
-            if not self._is_valid_project_id(proj_id):
-                continue
-            
-            baseline = proj_data.get('baseline_metrics', {})
-            actuals = proj_data.get('actuals_summary', {})
-            derived = proj_data.get('derived_metrics', {})
-            
-            owner = baseline.get('owner')
-            completion = derived.get('completion_pct')
-            hours = actuals.get('total_hours')
-            
-            if owner and completion and hours and hours > 0:
-                team_velocities[owner]['completed'] += completion
-                team_velocities[owner]['hours'] += hours
-                team_velocities[owner]['projects'].append(proj_id)
-        
-        velocity_analysis = []
-        
-        for team, data in team_velocities.items():
-            if data['hours'] > 0:
-                velocity = data['completed'] / data['hours']
-                velocity_analysis.append({
-                    'team': team,
-                    'velocity': velocity,
-                    'total_completion': data['completed'],
-                    'total_hours': data['hours'],
-                    'project_count': len(data['projects'])
-                })
-        
-        if velocity_analysis:
-            sorted_velocity = sorted(velocity_analysis, key=lambda x: x['velocity'])
-            
-            if len(sorted_velocity) >= 3:
-                lowest_performers = sorted_velocity[:3]
-                
-                self.manager_insights.append({
-                    'category': 'velocity',
-                    'title': f'Execution Velocity by Team: {len(velocity_analysis)} Teams Analyzed',
-                    'severity': 'info',
-                    'description': f"Velocity analysis across {len(velocity_analysis)} teams/owners",
-                    'impact': 'Identifies high and low performing teams',
-                    'recommendation': 'Share best practices from high-velocity teams with low performers',
-                    'metrics': {
-                        'team_count': len(velocity_analysis),
-                        'lowest_velocity': lowest_performers,
-                        'all_teams': velocity_analysis
-                    },
-                    'formula_used': 'Velocity = Completion % / Effort hours',
-                    'data_sources_used': ['tick', 'smartsheet'],
-                    'project_id': None,
-                    'confidence': 'High'
-                })
+        owners, completion, hours = self._col_owner, self._col_completion_pct, self._col_effort_hours
+        has_owner = np.fromiter((bool(o) for o in owners), dtype=bool, count=len(owners))
+        idx = np.flatnonzero(self._valid_mask & has_owner & _truthy(completion) & (hours > 0))
+        
+        # Sums accumulate in portfolio order per team, as the running totals did
+        codes, teams = pd.factorize(owners[idx])
+        total_completion = np.bincount(codes, weights=completion[idx], minlength=len(teams))
+        total_hours = np.bincount(codes, weights=hours[idx], minlength=len(teams))
+        project_counts = np.bincount(codes, minlength=len(teams))
+        velocity = total_completion / total_hours
+        
+        velocity_analysis = [{
+            'team': team,
+            'velocity': team_velocity,
+            'total_completion': team_completion,
+            'total_hours': team_hours,
+            'project_count': team_projects
+        } for team, team_velocity, team_completion, team_hours, team_projects in zip(
+            teams, velocity.tolist(), total_completion.tolist(), total_hours.tolist(), project_counts.tolist())]
+        
+        if len(velocity_analysis) >= 3:
+            lowest_performers = [velocity_analysis[i] for i in np.argsort(velocity, kind='stable')[:3]]
+            
+            self.manager_insights.append(self._make_insight(
+                category='velocity',
+                title=f'Execution Velocity by Team: {len(velocity_analysis)} Teams Analyzed',
+                severity='info',
+                description=f"Velocity analysis across {len(velocity_analysis)} teams/owners",
+                impact='Identifies high and low performing teams',
+                recommendation='Share best practices from high-velocity teams with low performers',
+                metrics={
+                    'team_count': len(velocity_analysis),
+                    'lowest_velocity': lowest_performers,
+                    'all_teams': velocity_analysis
+                },
+                formula_used='Velocity = Completion % / Effort hours',
+                data_sources_used=['tick', 'smartsheet']
+            ))
+    
+    def _index_by_project(self, insights: List[Dict]) -> Dict[Any, List[Dict]]:
+        """Group one persona's insights by project_id, keeping emission order"""
+        index = {}
+        for insight in insights:
+            index.setdefault(insight.get('project_id'), []).append(insight)
+        return index
+    
+    def _sorted_by_severity(self, insights: List[Dict]) -> List[Dict]:
+        """Insights ordered most urgent first (stable within a severity)"""
+        rank = SEVERITY_RANK.get
+        return sorted(insights, key=lambda insight: rank(insight['severity'], 3))
+    
+    def _insights_for_project(self, index: Dict[Any, List[Dict]], project_id: str) -> List[Dict]:
+        """One project's insights from a persona index (already most urgent first)"""
+        if project_id not in self._valid_project_ids:
+            return []
+        return list(index.get(project_id, []))
     
     def get_executive_insights(self) -> List[Dict]:
         """Get insights for C-Level executives"""
-        return sorted(self.executive_insights, key=lambda x: {'critical': 0, 'high': 1, 'warning': 2, 'info': 3}.get(x['severity'], 3))
+        return list(self.executive_insights)
     
     def get_vp_insights(self) -> List[Dict]:
         """Get insights for VP / Portfolio Owners"""
-        return sorted(self.vp_insights, key=lambda x: {'critical': 0, 'high': 1, 'warning': 2, 'info': 3}.get(x['severity'], 3))
+        return list(self.vp_insights)
     
     def get_manager_insights(self) -> List[Dict]:
         """Get insights for Managers / Delivery Leads"""
-        return sorted(self.manager_insights, key=lambda x: {'critical': 0, 'high': 1, 'warning': 2, 'info': 3}.get(x['severity'], 3))
+        return list(self.manager_insights)
     
     def get_project_executive_insights(self, project_id: str) -> List[Dict]:
         """Get executive insights for a specific project"""
-        if not self._is_valid_project_id(project_id):
-            return []
-        filtered = [i for i in self.executive_insights if i.get('project_id') == project_id]
-        return sorted(filtered, key=lambda x: {'critical': 0, 'high': 1, 'warning': 2, 'info': 3}.get(x['severity'], 3))
+        return self._insights_for_project(self._exec_by_pid, project_id)
     
     def get_project_vp_insights(self, project_id: str) -> List[Dict]:
         """Get VP insights for a specific project"""
-        if not self._is_valid_project_id(project_id):
-            return []
-        filtered = [i for i in self.vp_insights if i.get('project_id') == project_id]
-        return sorted(filtered, key=lambda x: {'critical': 0, 'high': 1, 'warning': 2, 'info': 3}.get(x['severity'], 3))
+        return self._insights_for_project(self._vp_by_pid, project_id)
     
     def get_project_manager_insights(self, project_id: str) -> List[Dict]:
         """Get manager insights for a specific project"""
-        if not self._is_valid_project_id(project_id):
-            return []
-        filtered = [i for i in self.manager_insights if i.get('project_id') == project_id]
-        return sorted(filtered, key=lambda x: {'critical': 0, 'high': 1, 'warning': 2, 'info': 3}.get(x['severity'], 3))
+        return self._insights_for_project(self._mgr_by_pid, project_id)
+    
+    def _write_json(self, data, filepath: str):
+        """Write an export as indented JSON (orjson when installed; other objects via str())"""
+        if orjson is None:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+            return
+        
+        # Datetimes are passed through to str() so both paths render them identically
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=options))
     
     def export_project_analysis(self, project_id: str, filepath: str):
         """Export single project analysis to JSON"""
@@ -2164,8 +2306,7 @@ class PortfolioAIEngine:
             print(f"❌ Project {project_id} not found")
             return
         
-        with open(filepath, 'w') as f:
-            json.dump(self.projects[project_id], f, indent=2, default=str)
+        self._write_json(self.projects[project_id], filepath)
         print(f"✅ Exported {project_id} analysis to {filepath}")
     
     def export_portfolio_analysis(self, filepath: str):
@@ -2180,18 +2321,49 @@ class PortfolioAIEngine:
             }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(portfolio_data, f, indent=2, default=str)
+        self._write_json(portfolio_data, filepath)
         print(f"✅ Exported portfolio analysis to {filepath}")
 
 
+def _read_excel_cached(path: str) -> pd.DataFrame:
+    """Read an Excel export through a Parquet copy that is rebuilt whenever the workbook changes"""
+    parquet_path = os.path.splitext(path)[0] + '.parquet'
+    failed_marker = parquet_path + '.failed'
+    source_mtime = os.path.getmtime(path)
+    
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= source_mtime:
+        try:
+            return pd.read_parquet(parquet_path, engine='pyarrow')
+        except (ImportError, OSError, ValueError):
+            pass
+    
+    df = pd.read_excel(path)
+    
+    # The cache is best-effort: without pyarrow it is simply off, and a workbook Parquet couldn't store
+    # (mixed-type columns, unwritable directory) is not retried until it changes
+    if not (os.path.exists(failed_marker) and os.path.getmtime(failed_marker) >= source_mtime):
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+        except ImportError:
+            pass
+        except (OSError, TypeError, ValueError):
+            try:
+                if os.path.exists(parquet_path):
+                    os.remove(parquet_path)
+                open(failed_marker, 'w').close()
+            except OSError:
+                pass
+    
+    return df
+
+
 if __name__ == "__main__":
     
     engine = PortfolioAIEngine()
     
-    smartsheet_df = pd.read_excel("smartsheet_export.xlsx")
-    wave_df = pd.read_excel("wave_export.xlsx")
-    tick_df = pd.read_excel("tick_export.xlsx")
+    smartsheet_df = _read_excel_cached("smartsheet_export.xlsx")
+    wave_df = _read_excel_cached("wave_export.xlsx")
+    tick_df = _read_excel_cached("tick_export.xlsx")
     
     engine.load_smartsheet(smartsheet_df)
     engine.load_wave(wave_df)
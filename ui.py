@@ -17,19 +17,48 @@ NEW FEATURES:
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 from datetime import datetime
+import hashlib
+import io
 import json
 from ai_engine import PortfolioAIEngine
-import os
 import numpy as np
-from collections import defaultdict
 
 
-def load_custom_css():
-    """Apply custom CSS styling for enterprise dashboard"""
-    st.markdown("""
+STATUS_COLORS = {
+    'On Track': '#10b981',
+    'At Risk': '#f59e0b',
+    'Delayed': '#ef4444',
+    'Unknown': '#9ca3af'
+}
+
+HEALTH_COLORS = {
+    'Green': '#10b981',
+    'green': '#10b981',
+    'Yellow': '#f59e0b',
+    'yellow': '#f59e0b',
+    'Red': '#ef4444',
+    'red': '#ef4444',
+    'Unknown': '#9ca3af',
+    'unknown': '#9ca3af'
+}
+
+SEVERITY_ICONS = {
+    'critical': '🚨',
+    'high': '⚠️',
+    'warning': '⚠️',
+    'info': 'ℹ️'
+}
+
+SEVERITY_BACKGROUNDS = {
+    'critical': 'linear-gradient(135deg, #dc2626 0%, #991b1b 100%)',
+    'high': 'linear-gradient(135deg, #ea580c 0%, #b45309 100%)',
+    'warning': 'linear-gradient(135deg, #eab308 0%, #b45309 100%)',
+    'info': 'linear-gradient(135deg, #0284c7 0%, #075985 100%)'
+}
+
+CUSTOM_CSS = """
     <style>
         /* ==================== FORCE LIGHT MODE ==================== */
         :root {
@@ -592,25 +621,25 @@ def load_custom_css():
             }
         }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
 
-def create_status_distribution_chart(summary):
-    """Create pie chart of project status distribution"""
-    status_dist = summary.get('status_distribution', {})
+def load_custom_css():
+    """Apply custom CSS styling for enterprise dashboard"""
+    # Streamlit drops elements a rerun doesn't emit, so the style block is re-sent each run
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def create_status_distribution_chart(status_items):
+    """Create pie chart of project status distribution from (status, count) pairs"""
+    status_dist = dict(status_items)
     
     if not status_dist:
         return None
     
-    colors = {
-        'On Track': '#10b981',
-        'At Risk': '#f59e0b',
-        'Delayed': '#ef4444',
-        'Unknown': '#9ca3af'
-    }
-    
     labels = list(status_dist.keys())
     values = list(status_dist.values())
-    chart_colors = [colors.get(label, '#94a3b8') for label in labels]
+    chart_colors = [STATUS_COLORS.get(label, '#94a3b8') for label in labels]
     
     fig = go.Figure(data=[go.Pie(
         labels=labels,
@@ -633,26 +662,16 @@ def create_status_distribution_chart(summary):
     return fig
 
 
-def create_health_distribution_chart(summary):
-    """Create bar chart of health indicators with enforced color mapping"""
-    health_dist = summary.get('health_distribution', {})
+@st.cache_data(show_spinner=False)
+def create_health_distribution_chart(health_items):
+    """Create bar chart of health indicators with enforced color mapping from (health, count) pairs"""
+    health_dist = dict(health_items)
     
     if not health_dist:
         return None
     
-    colors_map = {
-        'Green': '#10b981',
-        'green': '#10b981',
-        'Yellow': '#f59e0b',
-        'yellow': '#f59e0b',
-        'Red': '#ef4444',
-        'red': '#ef4444',
-        'Unknown': '#9ca3af',
-        'unknown': '#9ca3af'
-    }
-    
     df = pd.DataFrame(list(health_dist.items()), columns=['Health', 'Count'])
-    df['Color'] = df['Health'].apply(lambda x: colors_map.get(x, colors_map.get(x.lower(), '#9ca3af')))
+    df['Color'] = df['Health'].apply(lambda x: HEALTH_COLORS.get(x, HEALTH_COLORS.get(x.lower(), '#9ca3af')))
     
     fig = go.Figure(data=[go.Bar(
         x=df['Health'],
@@ -679,36 +698,65 @@ def create_health_distribution_chart(summary):
     return fig
 
 
-def create_budget_variance_chart(projects):
-    """Create chart showing budget variance across projects"""
-    data = []
-    
+PROJECT_TABLE_COLUMNS = ['Project ID', 'Project Name', 'Status', 'Health', 'Confidence']
+
+
+def projects_to_df(projects):
+    """One row per project with every field the tables and charts read, built in a single pass"""
+    rows = []
     for project_id, project_data in projects.items():
-        derived = project_data.get('derived_metrics', {})
         metadata = project_data.get('project_metadata', {})
-        
-        cost_var = derived.get('cost_variance_pct')
-        if cost_var is not None:
-            data.append({
-                'Project': metadata.get('project_name', project_id),
-                'Project ID': project_id,
-                'Variance %': cost_var
-            })
-    
-    if not data:
+        overall = project_data.get('assessment', {}).get('overall_assessment', {})
+        derived = project_data.get('derived_metrics', {})
+        rows.append((
+            project_id,
+            metadata.get('project_name', 'Unknown'),
+            overall.get('status', 'Unknown'),
+            overall.get('health', 'Unknown'),
+            overall.get('confidence_level', 'Unknown'),
+            metadata.get('project_name', project_id),
+            derived.get('cost_variance_pct'),
+            derived.get('schedule_variance_days')
+        ))
+    
+    return pd.DataFrame(rows, columns=PROJECT_TABLE_COLUMNS + ['Chart Label', 'cost_variance_pct', 'schedule_variance_days'],
+                        dtype=object)
+
+
+def variance_frame(projects_df, metric):
+    """(label, project id, value) rows for the projects that have the given derived metric"""
+    return projects_df.loc[projects_df[metric].notna(), ['Chart Label', 'Project ID', metric]]
+
+
+MAX_VARIANCE_BARS = 50
+
+
+def extreme_rows(sorted_df):
+    """Both ends of a sorted variance frame, capped at MAX_VARIANCE_BARS bars so large portfolios stay readable"""
+    if len(sorted_df) <= MAX_VARIANCE_BARS:
+        return sorted_df
+    half = MAX_VARIANCE_BARS // 2
+    return pd.concat([sorted_df.head(half), sorted_df.tail(half)])
+
+
+def shown_note(shown, total):
+    """Subtitle suffix naming how many bars a capped variance chart kept"""
+    return '' if shown == total else f' | {shown} most extreme of {total} shown'
+
+
+@st.cache_data(show_spinner=False)
+def create_budget_variance_chart(variance_df):
+    """Create chart showing budget variance across projects"""
+    if variance_df.empty:
         return None
     
-    df = pd.DataFrame(data)
+    df = variance_df.set_axis(['Project', 'Project ID', 'Variance %'], axis=1).astype({'Variance %': float})
     df = df.sort_values('Variance %')
+    total = len(df)
+    df = extreme_rows(df)
     
-    colors = []
-    for x in df['Variance %']:
-        if x < -10:
-            colors.append('#ef4444')
-        elif x > 5:
-            colors.append('#10b981')
-        else:
-            colors.append('#f59e0b')
+    variance = df['Variance %'].to_numpy()
+    colors = np.select([variance < -10, variance > 5], ['#ef4444', '#10b981'], default='#f59e0b')
     
     fig = go.Figure(data=[go.Bar(
         x=df['Project'],
@@ -726,7 +774,7 @@ def create_budget_variance_chart(projects):
     )])
     
     fig.update_layout(
-        title='Budget Variance by Project<br><sub>Negative = Over Budget | Positive = Under Budget</sub>',
+        title=f'Budget Variance by Project<br><sub>Negative = Over Budget | Positive = Under Budget{shown_note(len(df), total)}</sub>',
         xaxis_title='Projects',
         yaxis_title='Variance % (negative = overrun)',
         height=600,
@@ -742,36 +790,19 @@ def create_budget_variance_chart(projects):
     return fig
 
 
-def create_schedule_variance_chart(projects):
+@st.cache_data(show_spinner=False)
+def create_schedule_variance_chart(variance_df):
     """Create chart showing schedule variance"""
-    data = []
-    
-    for project_id, project_data in projects.items():
-        derived = project_data.get('derived_metrics', {})
-        metadata = project_data.get('project_metadata', {})
-        
-        schedule_var = derived.get('schedule_variance_days')
-        if schedule_var is not None:
-            data.append({
-                'Project': metadata.get('project_name', project_id),
-                'Project ID': project_id,
-                'Delay (Days)': schedule_var
-            })
-    
-    if not data:
+    if variance_df.empty:
         return None
     
-    df = pd.DataFrame(data)
+    df = variance_df.set_axis(['Project', 'Project ID', 'Delay (Days)'], axis=1).astype({'Delay (Days)': float})
     df = df.sort_values('Delay (Days)', ascending=False)
+    total = len(df)
+    df = extreme_rows(df)
     
-    colors = []
-    for x in df['Delay (Days)']:
-        if x > 30:
-            colors.append('#ef4444')
-        elif x <= 0:
-            colors.append('#10b981')
-        else:
-            colors.append('#f59e0b')
+    delay = df['Delay (Days)'].to_numpy()
+    colors = np.select([delay > 30, delay <= 0], ['#ef4444', '#10b981'], default='#f59e0b')
     
     fig = go.Figure(data=[go.Bar(
         x=df['Project'],
@@ -789,7 +820,7 @@ def create_schedule_variance_chart(projects):
     )])
     
     fig.update_layout(
-        title='Schedule Variance by Project<br><sub>Positive = Delayed | Negative = Ahead of Schedule</sub>',
+        title=f'Schedule Variance by Project<br><sub>Positive = Delayed | Negative = Ahead of Schedule{shown_note(len(df), total)}</sub>',
         xaxis_title='Projects',
         yaxis_title='Days (positive = delayed)',
         height=600,
@@ -805,9 +836,10 @@ def create_schedule_variance_chart(projects):
     return fig
 
 
-def create_data_completeness_chart(summary):
-    """Create chart showing data source coverage"""
-    completeness = summary.get('data_completeness', {})
+@st.cache_data(show_spinner=False)
+def create_data_completeness_chart(completeness_items):
+    """Create chart showing data source coverage from (coverage level, count) pairs"""
+    completeness = dict(completeness_items)
     
     if not completeness:
         return None
@@ -892,39 +924,18 @@ def display_insight_card(insight: dict, projects_map: dict = None):
     severity = insight.get('severity', 'info')
     confidence = insight.get('confidence', 'Unknown')
     
-    severity_colors = {
-        'critical': 'alert-critical',
-        'high': 'alert-warning',
-        'warning': 'alert-warning',
-        'info': 'alert-info'
-    }
-    
-    severity_icons = {
-        'critical': '🚨',
-        'high': '⚠️',
-        'warning': '⚠️',
-        'info': 'ℹ️'
-    }
-    
-    alert_class = severity_colors.get(severity, 'alert-info')
-    icon = severity_icons.get(severity, 'ℹ️')
+    icon = SEVERITY_ICONS.get(severity, 'ℹ️')
     
     title = insight['title']
     metrics = insight.get('metrics', {})
     
-    severity_background = {
-        'critical': 'linear-gradient(135deg, #dc2626 0%, #991b1b 100%)',
-        'high': 'linear-gradient(135deg, #ea580c 0%, #b45309 100%)',
-        'warning': 'linear-gradient(135deg, #eab308 0%, #b45309 100%)',
-        'info': 'linear-gradient(135deg, #0284c7 0%, #075985 100%)'
-    }
-    
-    bg_style = severity_background.get(severity, 'linear-gradient(135deg, #6366f1 0%, #7c3aed 100%)')
+    bg_style = SEVERITY_BACKGROUNDS.get(severity, 'linear-gradient(135deg, #6366f1 0%, #7c3aed 100%)')
     
     header_html = f'<div class="white-header-text" style="background: {bg_style}; padding: 1.5rem; border-radius: 10px; color: #ffffff !important; margin: 0.5rem 0; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);"><h4 style="margin: 0 !important; color: #ffffff !important; font-size: 1.3rem !important; font-weight: 700 !important; text-shadow: 0 2px 4px rgba(0,0,0,0.6) !important; background: transparent !important;">{icon} {title}</h4></div>'
-    st.markdown(header_html, unsafe_allow_html=True)
     
+    # Header and body go out as one markdown element per card
     st.markdown(f"""
+    {header_html}
     <div class="insight-box insight-{severity}">
         <p style="margin: 8px 0; color: #1a202c;"><strong>📁 Category:</strong> {insight['category'].replace('_', ' ').title()}</p>
         <p style="margin: 8px 0; color: #1a202c;"><strong>📊 Confidence:</strong> {confidence}</p>
@@ -1025,6 +1036,7 @@ def display_project_assessment(project_data):
     baseline = project_data.get('baseline_metrics', {})
     wave = project_data.get('latest_wave_snapshot', {})
     actuals = project_data.get('actuals_summary', {})
+    derived = project_data.get('derived_metrics', {})
     
     st.markdown("**Available Data:**")
     badges = []
@@ -1082,12 +1094,14 @@ def display_project_assessment(project_data):
     else:
         st.success("Complete data from all sources")
     
-    if assessment.get('recommendations'):
+    recommendations = assessment.get('recommendations')
+    if recommendations:
         st.markdown("#### 💡 Recommendations")
-        for rec in assessment['recommendations']:
+        for rec in recommendations:
             st.info(rec)
     
-    with st.expander("📈 View Detailed Metrics"):
+    # Expander bodies render even while collapsed, so the JSON dumps sit behind a toggle instead
+    if st.toggle("📈 View Detailed Metrics", key=f"detailed_metrics_{metadata.get('project_id')}"):
         
         col1, col2 = st.columns(2)
         
@@ -1112,7 +1126,6 @@ def display_project_assessment(project_data):
                 st.caption("No Tick data")
             
             st.markdown("**Derived Metrics**")
-            derived = project_data.get('derived_metrics', {})
             if derived:
                 st.json(derived)
             else:
@@ -1124,8 +1137,9 @@ def display_project_assessment(project_data):
             for rule in rules:
                 st.markdown(f"**{rule.get('rule')}** - *{rule.get('severity')}*")
                 st.markdown(f"Description: {rule.get('description')}")
-                if rule.get('recommendation'):
-                    st.markdown(f"Recommendation: {rule.get('recommendation')}")
+                recommendation = rule.get('recommendation')
+                if recommendation:
+                    st.markdown(f"Recommendation: {recommendation}")
                 st.markdown("---")
 
 
@@ -1143,6 +1157,145 @@ def remove_duplicate_insights(insights):
     return unique_insights
 
 
+def upload_source(uploaded_file, sheet_name):
+    """(bytes, file name, sheet name) for an uploaded export, or None"""
+    if not uploaded_file:
+        return None
+    return uploaded_file.getvalue(), uploaded_file.name, sheet_name or None
+
+
+def source_key(source):
+    """Cache key for an upload_source tuple: the file bytes are hashed once into a blake2b digest"""
+    if source is None:
+        return None
+    file_bytes, file_name, sheet_name = source
+    return hashlib.blake2b(file_bytes, digest_size=16).hexdigest(), file_name, sheet_name
+
+
+def read_source(file_bytes, file_name, sheet_name):
+    """Parse one uploaded export (CSV or Excel) from its raw bytes"""
+    buffer = io.BytesIO(file_bytes)
+    if file_name.endswith('.csv'):
+        return pd.read_csv(buffer)
+    return pd.read_excel(buffer, sheet_name=sheet_name)
+
+
+# One cached engine is shared by every session that uploads the same files, so callers treat it as read-only;
+# the portfolio summary is computed here once instead of per session. Bounded so old uploads don't stay resident.
+@st.cache_resource(show_spinner=False, max_entries=4, ttl=60 * 60)
+def build_engine(source_keys, _sources):
+    """Load and analyze the uploaded exports into (engine, portfolio summary); cached on source_keys so re-running
+    the same files reuses the engine (the leading underscore stops Streamlit from hashing the raw bytes again)"""
+    smartsheet_source, wave_source, tick_source = _sources
+    engine = PortfolioAIEngine()
+    
+    if smartsheet_source:
+        engine.load_smartsheet(read_source(*smartsheet_source))
+    if wave_source:
+        engine.load_wave(read_source(*wave_source))
+    if tick_source:
+        engine.load_tick(read_source(*tick_source))
+    
+    engine.analyze_all_projects()
+    engine.generate_all_insights()
+    return engine, engine.get_portfolio_summary()
+
+
+@st.fragment
+def insights_panel(engine, summary, projects_map):
+    """Persona selector, overview and filtered insight cards; widget changes here rerun only this panel"""
+    st.markdown('<p class="section-header">👤 Select Your Persona</p>', unsafe_allow_html=True)
+    
+    persona = st.radio(
+        "View insights tailored to your role:",
+        ["Executive (C-Level)", "VP / Portfolio Owner", "Manager / Delivery Lead", "All Insights"],
+        horizontal=True
+    )
+    
+    st.markdown('<p class="section-header">📊 Portfolio Overview</p>', unsafe_allow_html=True)
+    
+    overview = summary['portfolio_overview']
+    st.info(f"**Total Projects:** {overview['total_projects']} | **Analysis Time:** {overview['analysis_timestamp']}")
+    
+    create_portfolio_metrics_summary(summary)
+    
+    st.markdown('<p class="section-header">💡 Decision-Grade Insights</p>', unsafe_allow_html=True)
+    
+    if persona == "Executive (C-Level)":
+        insights = engine.get_executive_insights()
+        st.markdown("**🎯 Strategic & Portfolio-Level Insights**")
+    elif persona == "VP / Portfolio Owner":
+        insights = engine.get_vp_insights()
+        st.markdown("**📈 Portfolio Management & Risk Insights**")
+    elif persona == "Manager / Delivery Lead":
+        insights = engine.get_manager_insights()
+        st.markdown("**🔧 Operational & Execution Insights**")
+    else:
+        exec_insights = engine.get_executive_insights()
+        vp_insights = engine.get_vp_insights()
+        mgr_insights = engine.get_manager_insights()
+        
+        st.markdown("**All Personas Combined:**")
+        insights = exec_insights + vp_insights + mgr_insights
+        insights = remove_duplicate_insights(insights)
+    
+    if insights:
+        categories = list(dict.fromkeys(i['category'] for i in insights))
+        selected_categories = st.multiselect(
+            "Filter by Category:",
+            options=categories,
+            default=categories,
+            format_func=lambda x: x.replace('_', ' ').title()
+        )
+        
+        severities = ['critical', 'high', 'warning', 'info']
+        selected_severity = st.multiselect(
+            "Filter by Severity:",
+            options=severities,
+            default=['critical', 'high', 'warning'],
+            format_func=lambda x: x.title()
+        )
+        
+        category_set, severity_set = frozenset(selected_categories), frozenset(selected_severity)
+        filtered_insights = [i for i in insights if i['category'] in category_set and i['severity'] in severity_set]
+        
+        st.markdown(f"**Showing {len(filtered_insights)} insights**")
+        
+        for insight in filtered_insights:
+            display_insight_card(insight, projects_map)
+    else:
+        st.info("No insights generated yet. Complete the analysis to see insights.")
+
+
+@st.fragment
+def project_insights_panel(engine, selected_project, projects_map):
+    """Persona-specific insights for one project; switching persona reruns only this panel"""
+    project_persona = st.radio(
+        "Select persona to view project-specific insights:",
+        ["Executive (C-Level)", "VP / Portfolio Owner", "Manager / Delivery Lead"],
+        horizontal=True,
+        key=f"project_persona_{selected_project}"
+    )
+    
+    if project_persona == "Executive (C-Level)":
+        project_insights = engine.get_project_executive_insights(selected_project)
+        st.markdown("**🎯 Strategic Insights for This Project**")
+    elif project_persona == "VP / Portfolio Owner":
+        project_insights = engine.get_project_vp_insights(selected_project)
+        st.markdown("**📈 Portfolio Management Insights for This Project**")
+    else:
+        project_insights = engine.get_project_manager_insights(selected_project)
+        st.markdown("**🔧 Operational Insights for This Project**")
+    
+    if project_insights:
+        st.markdown(f"**Showing {len(project_insights)} project-level insights**")
+        
+        for insight in project_insights:
+            display_insight_card(insight, projects_map)
+    else:
+        st.info("No project-specific insights for this persona.")
+
+
 def main():
     """Main application"""
     
@@ -1233,43 +1386,25 @@ def main():
         try:
             with st.spinner("🔄 Loading data and analyzing portfolio..."):
                 
-                engine = PortfolioAIEngine()
+                sources = (
+                    upload_source(smartsheet_file, sheet_config.get('smartsheet_sheet')),
+                    upload_source(wave_file, sheet_config.get('wave_sheet')),
+                    upload_source(tick_file, sheet_config.get('tick_sheet'))
+                )
+                engine, summary = build_engine(tuple(source_key(source) for source in sources), sources)
                 
                 if smartsheet_file:
-                    sheet_name = sheet_config.get('smartsheet_sheet') or None
-                    if smartsheet_file.name.endswith('.csv'):
-                        df = pd.read_csv(smartsheet_file)
-                    else:
-                        df = pd.read_excel(smartsheet_file, sheet_name=sheet_name)
-                    engine.load_smartsheet(df)
                     st.success("✅ Smartsheet loaded")
-                
                 if wave_file:
-                    sheet_name = sheet_config.get('wave_sheet') or None
-                    if wave_file.name.endswith('.csv'):
-                        df = pd.read_csv(wave_file)
-                    else:
-                        df = pd.read_excel(wave_file, sheet_name=sheet_name)
-                    engine.load_wave(df)
                     st.success("✅ Wave loaded")
-                
                 if tick_file:
-                    sheet_name = sheet_config.get('tick_sheet') or None
-                    if tick_file.name.endswith('.csv'):
-                        df = pd.read_csv(tick_file)
-                    else:
-                        df = pd.read_excel(tick_file, sheet_name=sheet_name)
-                    engine.load_tick(df)
                     st.success("✅ Tick loaded")
                 
-                projects = engine.analyze_all_projects()
-                
-                engine.generate_all_insights()
-                
-                summary = engine.get_portfolio_summary()
+                projects = engine.projects
                 
                 st.session_state['engine'] = engine
                 st.session_state['projects'] = projects
+                st.session_state['projects_df'] = projects_to_df(projects)
                 st.session_state['portfolio_summary'] = summary
                 
                 st.success("✅ Portfolio analysis complete!")
@@ -1286,74 +1421,11 @@ def main():
         summary = st.session_state['portfolio_summary']
         projects = st.session_state['projects']
         engine = st.session_state['engine']
+        projects_df = st.session_state['projects_df']
         
-        projects_map = {}
-        for project_id, project_data in projects.items():
-            metadata = project_data.get('project_metadata', {})
-            projects_map[project_id] = metadata.get('project_name', 'Unknown')
-        
-        st.markdown('<p class="section-header">👤 Select Your Persona</p>', unsafe_allow_html=True)
-        
-        persona = st.radio(
-            "View insights tailored to your role:",
-            ["Executive (C-Level)", "VP / Portfolio Owner", "Manager / Delivery Lead", "All Insights"],
-            horizontal=True
-        )
-        
-        st.markdown('<p class="section-header">📊 Portfolio Overview</p>', unsafe_allow_html=True)
+        projects_map = dict(zip(projects_df['Project ID'], projects_df['Project Name']))
         
-        overview = summary['portfolio_overview']
-        st.info(f"**Total Projects:** {overview['total_projects']} | **Analysis Time:** {overview['analysis_timestamp']}")
-        
-        create_portfolio_metrics_summary(summary)
-        
-        st.markdown('<p class="section-header">💡 Decision-Grade Insights</p>', unsafe_allow_html=True)
-        
-        if persona == "Executive (C-Level)":
-            insights = engine.get_executive_insights()
-            st.markdown("**🎯 Strategic & Portfolio-Level Insights**")
-        elif persona == "VP / Portfolio Owner":
-            insights = engine.get_vp_insights()
-            st.markdown("**📈 Portfolio Management & Risk Insights**")
-        elif persona == "Manager / Delivery Lead":
-            insights = engine.get_manager_insights()
-            st.markdown("**🔧 Operational & Execution Insights**")
-        else:
-            exec_insights = engine.get_executive_insights()
-            vp_insights = engine.get_vp_insights()
-            mgr_insights = engine.get_manager_insights()
-            
-            st.markdown("**All Personas Combined:**")
-            insights = exec_insights + vp_insights + mgr_insights
-            insights = remove_duplicate_insights(insights)
-        
-        if insights:
-            categories = list(set([i['category'] for i in insights]))
-            selected_categories = st.multiselect(
-                "Filter by Category:",
-                options=categories,
-                default=categories,
-                format_func=lambda x: x.replace('_', ' ').title()
-            )
-            
-            filtered_insights = [i for i in insights if i['category'] in selected_categories]
-            
-            severities = ['critical', 'high', 'warning', 'info']
-            selected_severity = st.multiselect(
-                "Filter by Severity:",
-                options=severities,
-                default=['critical', 'high', 'warning'],
-                format_func=lambda x: x.title()
-            )
-            
-            filtered_insights = [i for i in filtered_insights if i['severity'] in selected_severity]
-            
-            st.markdown(f"**Showing {len(filtered_insights)} insights**")
-            
-            for insight in filtered_insights:
-                display_insight_card(insight, projects_map)
-        else:
-            st.info("No insights generated yet. Complete the analysis to see insights.")
+        insights_panel(engine, summary, projects_map)
         
         if summary.get('top_concerns'):
             st.markdown('<p class="section-header">🚨 Top Portfolio Concerns</p>', unsafe_allow_html=True)
@@ -1387,60 +1459,44 @@ def main():
         ])
         
         with viz_tabs[0]:
-            fig = create_status_distribution_chart(summary)
+            fig = create_status_distribution_chart(tuple(summary.get('status_distribution', {}).items()))
             if fig:
                 st.plotly_chart(fig, use_container_width=True)
         
         with viz_tabs[1]:
-            fig = create_health_distribution_chart(summary)
+            fig = create_health_distribution_chart(tuple(summary.get('health_distribution', {}).items()))
             if fig:
                 st.plotly_chart(fig, use_container_width=True)
         
         with viz_tabs[2]:
-            fig = create_budget_variance_chart(projects)
+            fig = create_budget_variance_chart(variance_frame(projects_df, 'cost_variance_pct'))
             if fig:
                 st.plotly_chart(fig, use_container_width=True)
             else:
                 st.info("Insufficient budget data for visualization")
         
         with viz_tabs[3]:
-            fig = create_schedule_variance_chart(projects)
+            fig = create_schedule_variance_chart(variance_frame(projects_df, 'schedule_variance_days'))
             if fig:
                 st.plotly_chart(fig, use_container_width=True)
             else:
                 st.info("Insufficient schedule data for visualization")
         
         with viz_tabs[4]:
-            fig = create_data_completeness_chart(summary)
+            fig = create_data_completeness_chart(tuple(summary.get('data_completeness', {}).items()))
             if fig:
                 st.plotly_chart(fig, use_container_width=True)
         
         st.markdown('<p class="section-header">📋 Project Details</p>', unsafe_allow_html=True)
         
-        project_list = []
-        for project_id, project_data in projects.items():
-            metadata = project_data.get('project_metadata', {})
-            assessment = project_data.get('assessment', {})
-            overall = assessment.get('overall_assessment', {})
-            
-            project_list.append({
-                'Project ID': project_id,
-                'Project Name': metadata.get('project_name', 'Unknown'),
-                'Status': overall.get('status', 'Unknown'),
-                'Health': overall.get('health', 'Unknown'),
-                'Confidence': overall.get('confidence_level', 'Unknown')
-            })
-        
-        df_projects = pd.DataFrame(project_list)
-        
-        st.dataframe(df_projects, use_container_width=True, hide_index=True)
+        st.dataframe(projects_df[PROJECT_TABLE_COLUMNS], use_container_width=True, hide_index=True)
         
         st.markdown("### 🔍 Detailed Project Analysis")
         
         selected_project = st.selectbox(
             "Select a project to view detailed assessment:",
-            options=[p['Project ID'] for p in project_list],
-            format_func=lambda x: f"{x} - {next((p['Project Name'] for p in project_list if p['Project ID'] == x), 'Unknown')}"
+            options=list(projects_map),
+            format_func=lambda x: f"{x} - {projects_map.get(x, 'Unknown')}"
         )
         
         if selected_project:
@@ -1450,30 +1506,7 @@ def main():
             st.markdown("---")
             st.markdown("### 🎯 Persona-Based Insights for This Project")
             
-            project_persona = st.radio(
-                "Select persona to view project-specific insights:",
-                ["Executive (C-Level)", "VP / Portfolio Owner", "Manager / Delivery Lead"],
-                horizontal=True,
-                key=f"project_persona_{selected_project}"
-            )
-            
-            if project_persona == "Executive (C-Level)":
-                project_insights = engine.get_project_executive_insights(selected_project)
-                st.markdown("**🎯 Strategic Insights for This Project**")
-            elif project_persona == "VP / Portfolio Owner":
-                project_insights = engine.get_project_vp_insights(selected_project)
-                st.markdown("**📈 Portfolio Management Insights for This Project**")
-            else:
-                project_insights = engine.get_project_manager_insights(selected_project)
-                st.markdown("**🔧 Operational Insights for This Project**")
-            
-            if project_insights:
-                st.markdown(f"**Showing {len(project_insights)} project-level insights**")
-                
-                for insight in project_insights:
-                    display_insight_card(insight, projects_map)
-            else:
-                st.info("No project-specific insights for this persona.")
+            project_insights_panel(engine, selected_project, projects_map)
         
         st.markdown('<p class="section-header">📊 Portfolio Summary Report</p>', unsafe_allow_html=True)
         
@@ -1524,7 +1557,7 @@ def main():
             )
         
         with col2:
-            csv = df_projects.to_csv(index=False)
+            csv = projects_df[PROJECT_TABLE_COLUMNS].to_csv(index=False)
             st.download_button(
                 label="📥 Download Project List (CSV)",
                 data=csv,